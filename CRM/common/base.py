@@ -18,12 +18,15 @@ class BaseModel(AuditModel):
     class Meta:
         abstract = True
 
-    def save(self, *args, **kwargs):
+    def set_audit_fields(self):
+        """
+        Fill created_by/updated_by from the current user the way save() does.
+        Call it on instances written without save(), e.g. through bulk_create().
+        """
         user = get_current_user()
         if user is None or user.is_anonymous:
             self.created_by = None
             self.updated_by = None
-            super(BaseModel, self).save(*args, **kwargs)
         else:
             # Check if the model is being created or updated
             if self._state.adding:
@@ -32,7 +35,10 @@ class BaseModel(AuditModel):
                 self.updated_by = None
             # If updated only set updated_by value don't touch created_by
             self.updated_by = user
-            super(BaseModel, self).save(*args, **kwargs)
+
+    def save(self, *args, **kwargs):
+        self.set_audit_fields()
+        super(BaseModel, self).save(*args, **kwargs)
 
     def __str__(self):
         return str(self.id)
\ No newline at end of file
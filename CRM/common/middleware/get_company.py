@@ -1,5 +1,5 @@
 from rest_framework.exceptions import AuthenticationFailed
-from common.models import Profile
+from common.utils.external_auth import attach_profile
 
 
 class GetProfile:
@@ -13,10 +13,10 @@ class GetProfile:
     def __call__(self, request):
         # Attach profile to request if user is authenticated
         if request.user.is_authenticated:
-            try:
-                request.profile = Profile.objects.get(user=request.user, is_active=True)
-            except Profile.DoesNotExist:
-                request.profile = None
+            # Also caches it as request.user.profile for the rest of the request;
+            # request.profile itself is only set for an active profile
+            profile = attach_profile(request.user)
+            request.profile = profile if profile is not None and profile.is_active else None
         else:
             request.profile = None
 
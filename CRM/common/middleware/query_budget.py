@@ -0,0 +1,51 @@
+import logging
+
+from django.conf import settings
+from django.db import connection
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudget:
+    """
+    Development middleware that counts the queries each request runs on the
+    request's own DB connection and reports views that go over budget.
+
+    A view sets query_budget to declare its own limit, either one number or
+    a {method: number} dict; other views and methods get
+    settings.QUERY_BUDGET_DEFAULT. With settings.QUERY_BUDGET_STRICT the
+    request fails instead of only logging, so N+1 regressions show up
+    before they ship. With settings.ORM_READ_THREADS set, reads done through
+    run_concurrently use worker connections and are not counted.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        queries = []
+
+        def count_query(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(count_query):
+            response = self.get_response(request)
+
+        budget = getattr(request, "_query_budget", None)
+        if budget is not None and len(queries) > budget:
+            message = (
+                f"{request.method} {request.path} ran {len(queries)} queries, "
+                f"over its budget of {budget}"
+            )
+            if settings.QUERY_BUDGET_STRICT:
+                raise AssertionError(message)
+            logger.warning(message)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "view_class", None)
+        budget = getattr(view_class, "query_budget", settings.QUERY_BUDGET_DEFAULT)
+        if isinstance(budget, dict):
+            budget = budget.get(request.method, settings.QUERY_BUDGET_DEFAULT)
+        request._query_budget = budget
@@ -74,6 +74,24 @@ class ProfileSerializer(serializers.ModelSerializer):
         )
 
 
+# Columns ProfileSerializer and EmployeeSerializer render, for .only() on
+# profile querysets that select_related user
+PROFILE_SERIALIZER_ONLY_FIELDS = (
+    "id",
+    "role",
+    "phone",
+    "alternate_phone",
+    "is_active",
+    "created_at",
+    "updated_at",
+    "user__id",
+    "user__email",
+    "user__first_name",
+    "user__last_name",
+    "user__is_active",
+)
+
+
 class EmployeeSerializer(serializers.ModelSerializer):
     """Serializer for employee list with flat structure including User fields"""
     user_id = serializers.UUIDField(source='user.id', read_only=True)
@@ -0,0 +1,13 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from common.models import Profile
+from common.utils.external_auth import get_profile_cache_key
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def profile_changed(sender, instance, **kwargs):
+    """Drop the cached profile so the next request reloads it"""
+    cache.delete(get_profile_cache_key(instance.user_id))
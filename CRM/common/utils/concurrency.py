@@ -0,0 +1,72 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+logger = logging.getLogger(__name__)
+
+
+# Shared pool for independent ORM reads, created on first use with
+# settings.ORM_READ_THREADS threads. Worker threads keep their own DB
+# connections between tasks (subject to CONN_MAX_AGE), so reusing the same
+# few threads avoids reconnecting on every request.
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.ORM_READ_THREADS, thread_name_prefix="orm-read"
+                )
+    return _executor
+
+
+def _run_with_connection_cleanup(func):
+    """Run func in a worker thread, recycling its DB connection like a request would"""
+    close_old_connections()
+    try:
+        return func()
+    finally:
+        close_old_connections()
+
+
+def run_concurrently(*funcs):
+    """
+    Run independent read-only callables concurrently and return their
+    results in the same order as given.
+
+    Runs them one after another on the current connection when
+    settings.ORM_READ_THREADS is 0 (each thread costs a DB connection), and
+    inside a transaction, because other threads use other connections and
+    cannot see uncommitted rows.
+    """
+    if settings.ORM_READ_THREADS <= 0 or connection.in_atomic_block:
+        return [func() for func in funcs]
+
+    executor = _get_executor()
+    futures = [executor.submit(_run_with_connection_cleanup, func) for func in funcs]
+    return [future.result() for future in futures]
+
+
+def run_in_background(func, *args, **kwargs):
+    """
+    Run func(*args, **kwargs) on a daemon thread and return at once, for work
+    such as emails that the response does not wait for. The thread uses its
+    own DB connection, so call it after the data it reads is committed
+    (transaction.on_commit). Failures are logged, never raised. Needs a
+    long-lived worker process: a serverless function may be frozen as soon
+    as the response is sent.
+    """
+    def run():
+        try:
+            _run_with_connection_cleanup(lambda: func(*args, **kwargs))
+        except Exception:
+            logger.exception("Background task %s failed", getattr(func, "__name__", func))
+
+    threading.Thread(target=run, daemon=True).start()
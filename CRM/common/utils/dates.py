@@ -0,0 +1,23 @@
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+
+
+# {local date: (today_start, today_end)}; holds only the current day
+_today_bounds_cache = {}
+
+
+def get_today_bounds():
+    """
+    Return (today_start, today_end) as aware datetimes spanning the current
+    local day in TIME_ZONE. Computed once per day and reused until the date
+    rolls over.
+    """
+    today = timezone.localdate()
+    bounds = _today_bounds_cache.get(today)
+    if bounds is None:
+        today_start = timezone.make_aware(datetime.combine(today, time.min))
+        bounds = (today_start, today_start + timedelta(days=1))
+        _today_bounds_cache.clear()
+        _today_bounds_cache[today] = bounds
+    return bounds
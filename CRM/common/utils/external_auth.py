@@ -1,14 +1,60 @@
 from django.conf import settings
+from django.core.cache import cache
 from rest_framework.authentication import BaseAuthentication
+from rest_framework_simplejwt.authentication import JWTAuthentication
 from common.models import Profile,User
 
 from common.utils.authentication import verify_jwt_token
 
+
+# Profiles are read on every authenticated request; common.signals deletes
+# the entry whenever the profile is saved or deleted. Only used with a shared
+# cache (settings.SHARED_CACHE): with a per-process cache the delete would
+# miss the other workers and a deactivated or demoted user would keep their
+# old profile there until the entry expired.
+PROFILE_CACHE_TIMEOUT = 5 * 60
+
+
+def get_profile_cache_key(user_id):
+    return f"profile:{user_id}"
+
+
+def attach_profile(user):
+    """
+    Load the user's profile once and cache it as user.profile, so every later
+    user.profile lookup in the request is free. Like the reverse accessor it
+    replaces, this ignores is_active; callers that need an active profile
+    check it themselves. Caches None when there is no profile, so lookups
+    raise without querying.
+    """
+    cache_key = get_profile_cache_key(user.id)
+    profile = cache.get(cache_key) if settings.SHARED_CACHE else None
+    if profile is None:
+        try:
+            profile = Profile.objects.get(user_id=user.id)
+        except Profile.DoesNotExist:
+            User.profile.related.set_cached_value(user, None)
+            return None
+        if settings.SHARED_CACHE:
+            # Stored before user.profile is set so the user is not pickled with it
+            cache.set(cache_key, profile, PROFILE_CACHE_TIMEOUT)
+    # Also points profile.user back at this user, so no JOIN is needed
+    user.profile = profile
+    return profile
+
+
+class ProfileJWTAuthentication(JWTAuthentication):
+    """simplejwt header authentication that attaches the profile like CustomDualAuthentication"""
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+        attach_profile(user)
+        return user
+
 class CustomDualAuthentication(BaseAuthentication):
 
     def authenticate(self, request):
         jwt_user = None
-        profile = None
 
         # Check JWT authentication from HTTP-only cookie first (preferred method)
         jwt_token = None
@@ -30,16 +76,9 @@ class CustomDualAuthentication(BaseAuthentication):
                 # Get the user object
                 user = User.objects.get(id=jwt_payload['user_id'])
                 
-                # Try to get the profile for this user
+                # Attach profile to user object (avoid accessing request.user which triggers auth)
                 if jwt_payload['user_id'] is not None:
-                    try:
-                        profile = Profile.objects.select_related('user').get(
-                            user_id=jwt_payload['user_id'], is_active=True
-                        )
-                        # Attach profile to user object (avoid accessing request.user which triggers auth)
-                        user.profile = profile
-                    except Profile.DoesNotExist:
-                        pass
+                    attach_profile(user)
                 
                 return (user, None)
 
@@ -0,0 +1,33 @@
+from django.db.models import Count, Window
+from rest_framework.pagination import LimitOffsetPagination
+
+
+class WindowCountLimitOffsetPagination(LimitOffsetPagination):
+    """
+    LimitOffsetPagination that reads the total from a COUNT(*) OVER ()
+    window on the page query, instead of issuing a separate COUNT query.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.offset = self.get_offset(request)
+        page = list(
+            queryset.annotate(_total_count=Window(expression=Count("pk")))[
+                self.offset:self.offset + self.limit
+            ]
+        )
+        if page:
+            self.count = page[0]._total_count
+        elif self.offset:
+            # Offset is past the last row, so there is no row to carry the total
+            self.count = self.get_count(queryset)
+        else:
+            self.count = 0
+
+        if self.count > self.limit and self.template is not None:
+            self.display_page_controls = True
+        return page
@@ -0,0 +1,61 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.permissions import BasePermission
+
+from utils.roles_enum import ROLE_EMPLOYEE, ROLE_MANAGER
+
+
+class PermissionCheckFailed(APIException):
+    """
+    Rejects a request with the {"error": True, "message": ...} body the
+    views return themselves, instead of DRF's {"detail": ...}.
+    """
+    status_code = status.HTTP_403_FORBIDDEN
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.detail = {"error": True, "message": message}
+        if status_code is not None:
+            self.status_code = status_code
+
+
+class HasProfile(BasePermission):
+    """Allow only users with a profile attached by the authentication"""
+    message = "User profile not found."
+
+    def has_permission(self, request, view):
+        if getattr(request.user, "profile", None) is None:
+            raise PermissionCheckFailed(self.message, status.HTTP_400_BAD_REQUEST)
+        return True
+
+
+class IsManager(BasePermission):
+    """
+    Allow only managers and superusers, before the view loads anything.
+    Views can set manager_permission_message to word the rejection.
+    """
+    message = "Only managers can perform this action."
+
+    def has_permission(self, request, view):
+        if request.user.profile.role != ROLE_MANAGER and not request.user.is_superuser:
+            raise PermissionCheckFailed(getattr(view, "manager_permission_message", self.message))
+        return True
+
+
+class IsLeadOwnerOrManager(BasePermission):
+    """
+    Employees may only act on leads assigned to them; other roles may act on
+    any lead. Views can set lead_permission_message to word the rejection,
+    or to a dict of messages keyed by request method.
+    """
+    message = "You can only update leads assigned to you."
+
+    def has_object_permission(self, request, view, obj):
+        user_profile = request.user.profile
+        # Compare the FK column so the assigned profile is never loaded
+        if user_profile.role == ROLE_EMPLOYEE and obj.assigned_to_id != user_profile.id:
+            message = getattr(view, "lead_permission_message", self.message)
+            if isinstance(message, dict):
+                message = message.get(request.method, self.message)
+            raise PermissionCheckFailed(message)
+        return True
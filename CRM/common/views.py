@@ -1,6 +1,7 @@
 from django.conf import settings
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db.models import Count, Case, When, Value, CharField, OuterRef, Exists, Q
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
@@ -18,9 +19,16 @@ from common.models import Profile, User
 from common.serializer import *
 from common.tasks import send_email_user_delete
 from common.utils.choices import ROLES
-from leads.serializer import LeadNoteSerializer, LeadSerializer
+from common.utils.dates import get_today_bounds
+from leads.serializer import LEAD_SERIALIZER_ONLY_FIELDS, LeadNoteSerializer, LeadSerializer
 from leads.models import Lead, LeadNote, LeadNoteRead
-from utils.roles_enum import UserRole
+from leads.utils.cache import REMINDERS_CACHE_TIMEOUT, get_reminders_cache_key
+from leads.utils.reminders import (
+    REMINDER_BUCKETS,
+    get_reminder_bucket_expression,
+    get_reminder_bucket_filters,
+)
+from utils.roles_enum import ROLE_EMPLOYEE, ROLE_MANAGER
 
 User = get_user_model()
 
@@ -261,9 +269,9 @@ def create_employee(request):
             'error': 'User profile not found. Please contact administrator.'
         }, status=status.HTTP_403_FORBIDDEN)
     
-    user_role = int(request.user.profile.role) if request.user.profile.role is not None else None
+    user_role = request.user.profile.role
     
-    if user_role != UserRole.MANAGER.value:
+    if user_role != ROLE_MANAGER:
         return Response({
             'error': 'Only managers can create employees.'
         }, status=status.HTTP_403_FORBIDDEN)
@@ -307,7 +315,7 @@ def create_employee(request):
         # Create profile with employee role
         profile = Profile.objects.create(
             user=user,
-            role=UserRole.EMPLOYEE.value,
+            role=ROLE_EMPLOYEE,
             is_active=True,
             phone=phone if phone else None,
             alternate_phone=alternate_phone if alternate_phone else None,
@@ -426,7 +434,7 @@ class UsersListView(APIView, LimitOffsetPagination):
 
     permission_classes = (IsAuthenticated,)
     def post(self, request, format=None):
-        if int(self.request.user.profile.role) != UserRole.MANAGER.value and not self.request.user.is_superuser:
+        if self.request.user.profile.role != ROLE_MANAGER and not self.request.user.is_superuser:
             return Response(
                 {"error": True, "errors": "Permission Denied"},
                 status=status.HTTP_403_FORBIDDEN,
@@ -473,7 +481,7 @@ class UsersListView(APIView, LimitOffsetPagination):
 
 
     def get(self, request, format=None):
-        if int(self.request.user.profile.role) != UserRole.MANAGER.value and not self.request.user.is_superuser:
+        if self.request.user.profile.role != ROLE_MANAGER and not self.request.user.is_superuser:
             return Response(
                 {"error": True, "errors": "Permission Denied"},
                 status=status.HTTP_403_FORBIDDEN,
@@ -493,7 +501,8 @@ class UsersListView(APIView, LimitOffsetPagination):
             offset = queryset_active_users.filter(
                 id__gte=results_active_users[-1].id
             ).count()
-            if offset == queryset_active_users.count():
+            # self.count already holds the total from paginate_queryset
+            if offset == self.count:
                 offset = None
         else:
             offset = 0
@@ -512,7 +521,7 @@ class UsersListView(APIView, LimitOffsetPagination):
             offset = queryset_inactive_users.filter(
                 id__gte=results_inactive_users[-1].id
             ).count()
-            if offset == queryset_inactive_users.count():
+            if offset == self.count:
                 offset = None
         else:
             offset = 0
@@ -538,7 +547,7 @@ class UserDetailView(APIView):
     def get(self, request, pk, format=None):
         profile_obj = self.get_object(pk)
         if (
-            int(self.request.user.profile.role) != UserRole.MANAGER.value
+            self.request.user.profile.role != ROLE_MANAGER
             and not self.request.user.profile.is_admin
             and self.request.user.profile.id != profile_obj.id
         ):
@@ -558,7 +567,7 @@ class UserDetailView(APIView):
         profile = self.get_object(pk)
         address_obj = profile.address
         if (
-            int(self.request.user.profile.role) != UserRole.MANAGER.value
+            self.request.user.profile.role != ROLE_MANAGER
             and not self.request.user.is_superuser
             and self.request.user.profile.id != profile.id
         ):
@@ -599,7 +608,7 @@ class UserDetailView(APIView):
         )
 
     def delete(self, request, pk, format=None):
-        if int(self.request.user.profile.role) != UserRole.MANAGER.value and not self.request.user.profile.is_admin:
+        if self.request.user.profile.role != ROLE_MANAGER and not self.request.user.profile.is_admin:
             return Response(
                 {"error": True, "errors": "Permission Denied"},
                 status=status.HTTP_403_FORBIDDEN,
@@ -633,7 +642,7 @@ class UserStatusView(APIView):
     permission_classes = (IsAuthenticated,)
 
     def post(self, request, pk, format=None):
-        if int(self.request.user.profile.role) != UserRole.MANAGER.value and not self.request.user.is_superuser:
+        if self.request.user.profile.role != ROLE_MANAGER and not self.request.user.is_superuser:
             return Response(
                 {
                     "error": True,
@@ -672,7 +681,7 @@ class UserStatusView(APIView):
                 pass
 
         context = {}
-        context["ROLE_EMPLOYEE_VALUE"] = UserRole.EMPLOYEE.value
+        context["ROLE_EMPLOYEE_VALUE"] = ROLE_EMPLOYEE
         active_profiles = profiles.filter(is_active=True)
         inactive_profiles = profiles.filter(is_active=False)
         context["active_profiles"] = ProfileSerializer(active_profiles, many=True).data
@@ -694,7 +703,7 @@ class DashboardUnreadNotes(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        user_role = int(profile.role) if profile.role is not None else None
+        user_role = profile.role
 
         # Base unread notes query
         unread_notes = LeadNote.objects.filter(
@@ -704,7 +713,7 @@ class DashboardUnreadNotes(APIView):
         )
 
         # Role-based filtering
-        if user_role == UserRole.EMPLOYEE.value:
+        if user_role == ROLE_EMPLOYEE:
             unread_notes = unread_notes.filter(
                 lead__assigned_to=profile
             )
@@ -726,8 +735,9 @@ class DashboardUnreadNotes(APIView):
             'lead', 'lead__status', 'author', 'author__user'
         ).order_by('-created_at')
 
-        # Count (cheap query)
-        unread_count = unread_notes.count()
+        # Fetched once: the count comes from the same rows as the list
+        unread_notes = list(unread_notes)
+        unread_count = len(unread_notes)
 
         serializer = LeadNoteSerializer(unread_notes, many=True)
 
@@ -753,88 +763,79 @@ class DashboardReminders(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        user_role = int(profile.role) if profile.role is not None else None
+        user_role = profile.role
 
         # Base queryset (lean & indexed)
         leads = Lead.objects.filter(is_active=True)
 
-        if user_role == UserRole.EMPLOYEE.value:
+        if user_role == ROLE_EMPLOYEE:
             leads = leads.filter(assigned_to=profile)
 
-        # Time windows
-        now = timezone.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = today_start + timedelta(days=1)
+        # Time windows: the local day, matching the leads reminders endpoints
+        today_start, today_end = get_today_bounds()
 
-        counts = leads.aggregate(
-            overdue=Count(
-                'id',
-                filter=Q(
-                    follow_up_status='pending',
-                    follow_up_at__lt=today_start
-                ),
-            ),
-            due_today=Count(
-                'id',
-                filter=Q(
-                    follow_up_status='pending',
-                    follow_up_at__gte=today_start,
-                    follow_up_at__lt=today_end
-                ),
-            ),
-            upcoming=Count(
-                'id',
-                filter=Q(
-                    follow_up_status='pending',
-                    follow_up_at__gte=today_end
-                ),
-            ),
-            done=Count(
-                'id',
-                filter=Q(follow_up_status='done'),
-            ),
-        )
+        # Shares the reminders cache version, so any Lead change drops it;
+        # employees are cached per profile, managers share one entry. Only
+        # cached with a shared backend (see settings.SHARED_CACHE)
+        if settings.SHARED_CACHE:
+            scope = f"profile:{profile.id}" if user_role == ROLE_EMPLOYEE else "all"
+            cache_key = get_reminders_cache_key(scope, today_start.date(), "dashboard")
+            response_data = cache.get(cache_key)
+            if response_data is not None:
+                return Response(response_data, status=status.HTTP_200_OK)
 
-        overdue_qs = leads.filter(
-            follow_up_status='pending',
-            follow_up_at__lt=today_start
-        ).select_related('status', 'lifecycle', 'assigned_to', 'assigned_to__user').order_by('follow_up_at')
+        bucket_filters = get_reminder_bucket_filters(today_start, today_end)
 
-        due_today_qs = leads.filter(
-            follow_up_status='pending',
-            follow_up_at__gte=today_start,
-            follow_up_at__lt=today_end
-        ).select_related('status', 'lifecycle', 'assigned_to', 'assigned_to__user').order_by('follow_up_at')
+        # All four bucket counts in one aggregate
+        counts = leads.aggregate(
+            **{name: Count('id', filter=bucket_filters[name]) for name in REMINDER_BUCKETS}
+        )
 
-        upcoming_qs = leads.filter(
+        # Pending reminders in one query, tagged with their bucket by the database
+        # and split up here; done leads are not returned
+        reminder_leads = {"overdue": [], "due_today": [], "upcoming": []}
+        pending_leads = leads.filter(
             follow_up_status='pending',
-            follow_up_at__gte=today_end
-        ).select_related('status', 'lifecycle', 'assigned_to', 'assigned_to__user').order_by('follow_up_at')
+            follow_up_at__isnull=False,
+        ).annotate(
+            bucket=get_reminder_bucket_expression(today_start, today_end)
+        ).select_related(
+            'status', 'lifecycle', 'assigned_to', 'assigned_to__user', 'created_by'
+        ).only(*LEAD_SERIALIZER_ONLY_FIELDS).order_by('follow_up_at')
+        for lead in pending_leads:
+            reminder_leads[lead.bucket].append(lead)
+
+        # One serializer instance for all three buckets instead of a ListSerializer each
+        lead_serializer = LeadSerializer()
+        serialized_leads = {
+            name: [lead_serializer.to_representation(lead) for lead in bucket_leads]
+            for name, bucket_leads in reminder_leads.items()
+        }
 
-        return Response(
-            {
-                "success": True,
-                "reminders": {
-                    "overdue": {
-                        "count": counts["overdue"],
-                        "leads": LeadSerializer(overdue_qs, many=True).data,
-                    },
-                    "due_today": {
-                        "count": counts["due_today"],
-                        "leads": LeadSerializer(due_today_qs, many=True).data,
-                    },
-                    "upcoming": {
-                        "count": counts["upcoming"],
-                        "leads": LeadSerializer(upcoming_qs, many=True).data,
-                    },
-                    "done": {
-                        "count": counts["done"],
-                        "leads": [],
-                    },
+        response_data = {
+            "success": True,
+            "reminders": {
+                "overdue": {
+                    "count": counts["overdue"],
+                    "leads": serialized_leads["overdue"],
+                },
+                "due_today": {
+                    "count": counts["due_today"],
+                    "leads": serialized_leads["due_today"],
+                },
+                "upcoming": {
+                    "count": counts["upcoming"],
+                    "leads": serialized_leads["upcoming"],
+                },
+                "done": {
+                    "count": counts["done"],
+                    "leads": [],
                 },
             },
-            status=status.HTTP_200_OK,
-        )
+        }
+        if settings.SHARED_CACHE:
+            cache.set(cache_key, response_data, REMINDERS_CACHE_TIMEOUT)
+        return Response(response_data, status=status.HTTP_200_OK)
 
 class DashboardLeadStatusesAndEmployees(APIView):
     permission_classes = (IsAuthenticated,)
@@ -849,11 +850,11 @@ class DashboardLeadStatusesAndEmployees(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        user_role = int(profile.role) if profile.role is not None else None
+        user_role = profile.role
 
         leads = Lead.objects.filter(is_active=True)
 
-        if user_role == UserRole.EMPLOYEE.value:
+        if user_role == ROLE_EMPLOYEE:
             leads = leads.filter(assigned_to_id=profile.id)
 
         status_counts = (
@@ -865,10 +866,10 @@ class DashboardLeadStatusesAndEmployees(APIView):
 
         # ---- EMPLOYEE COUNT (cached) ----
         employee_count = 0
-        if user_role == UserRole.MANAGER.value:
+        if user_role == ROLE_MANAGER:
 
             employee_count = Profile.objects.filter(
-                role=UserRole.EMPLOYEE.value,
+                role=ROLE_EMPLOYEE,
                 is_active=True,
                 user__is_deleted=False,
             ).count()
@@ -895,14 +896,14 @@ class Dashboard(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        user_role = int(profile.role) if profile.role is not None else None
+        user_role = profile.role
 
         # Base lead queryset (role-based) with optimizations
         leads_base = Lead.objects.select_related(
-            'status', 'lifecycle', 'assigned_to', 'assigned_to__user'
+            'status', 'lifecycle', 'assigned_to', 'assigned_to__user', 'created_by'
         ).filter(is_active=True)
         
-        if user_role == UserRole.EMPLOYEE.value:
+        if user_role == ROLE_EMPLOYEE:
             leads_queryset = leads_base.filter(assigned_to=profile)
         else:
             leads_queryset = leads_base
@@ -921,61 +922,50 @@ class Dashboard(APIView):
                 lead__in=leads_queryset
             )
             .exclude(author__user=user)
-            .exclude(read_by__user=user)
+            .filter(~Exists(LeadNoteRead.objects.filter(note_id=OuterRef('pk'), user_id=user.id)))
             .select_related('lead', 'author', 'author__user', 'lead__status')
             .order_by('-created_at')
         )
 
-        unread_notes_count = unread_notes_qs.count()
+        # Fetched once: the count comes from the same rows as the list
+        unread_notes_qs = list(unread_notes_qs)
+        unread_notes_count = len(unread_notes_qs)
         unread_notes_serializer = LeadNoteSerializer(unread_notes_qs, many=True)
 
-        # Reminders - optimized with aggregation instead of loops
-        now = timezone.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = today_start + timedelta(days=1)
+        # Reminders - optimized with aggregation instead of loops, over the local day
+        today_start, today_end = get_today_bounds()
 
-        # Get counts only for summary
-        overdue_count = leads_queryset.filter(
-            follow_up_status='pending',
-            follow_up_at__lt=today_start
-        ).count()
-        
-        due_today_count = leads_queryset.filter(
-            follow_up_status='pending',
-            follow_up_at__gte=today_start,
-            follow_up_at__lt=today_end
-        ).count()
-        
-        upcoming_count = leads_queryset.filter(
-            follow_up_status='pending',
-            follow_up_at__gte=today_end
-        ).count()
-        
-        done_count = leads_queryset.filter(
-            follow_up_status='done'
-        ).count()
+        bucket_filters = get_reminder_bucket_filters(today_start, today_end)
 
-        overdue_leads = list(leads_queryset.filter(
-            follow_up_status='pending',
-            follow_up_at__lt=today_start
-        ))
-        
-        due_today_leads = list(leads_queryset.filter(
-            follow_up_status='pending',
-            follow_up_at__gte=today_start,
-            follow_up_at__lt=today_end
-        ))
-        
-        upcoming_leads = list(leads_queryset.filter(
+        # Get counts only for summary, all four in one aggregate
+        reminder_counts = leads_queryset.aggregate(
+            **{name: Count('id', filter=bucket_filters[name]) for name in REMINDER_BUCKETS}
+        )
+
+        # Pending reminders in one query, tagged with their bucket by the database
+        # and split up here; done leads are not returned
+        reminder_leads = {"overdue": [], "due_today": [], "upcoming": []}
+        pending_leads = leads_queryset.filter(
             follow_up_status='pending',
-            follow_up_at__gte=today_end
-        ))
+            follow_up_at__isnull=False,
+        ).annotate(
+            bucket=get_reminder_bucket_expression(today_start, today_end)
+        ).only(*LEAD_SERIALIZER_ONLY_FIELDS)
+        for lead in pending_leads:
+            reminder_leads[lead.bucket].append(lead)
+
+        # One serializer instance for all three buckets instead of a ListSerializer each
+        lead_serializer = LeadSerializer()
+        serialized_leads = {
+            name: [lead_serializer.to_representation(lead) for lead in bucket_leads]
+            for name, bucket_leads in reminder_leads.items()
+        }
 
         # Employee count - cached
         employee_count = 0
-        if user_role == UserRole.MANAGER.value:
+        if user_role == ROLE_MANAGER:
             employee_count = Profile.objects.filter(
-                role=UserRole.EMPLOYEE.value,
+                role=ROLE_EMPLOYEE,
                 is_active=True,
                 user__is_deleted=False
             ).count()
@@ -989,19 +979,19 @@ class Dashboard(APIView):
             "lead_statuses": list(status_counts),
             "reminders": {
                 "overdue": {
-                    "count": overdue_count,
-                    "leads": LeadSerializer(overdue_leads, many=True).data,
+                    "count": reminder_counts["overdue"],
+                    "leads": serialized_leads["overdue"],
                 },
                 "due_today": {
-                    "count": due_today_count,
-                    "leads": LeadSerializer(due_today_leads, many=True).data,
+                    "count": reminder_counts["due_today"],
+                    "leads": serialized_leads["due_today"],
                 },
                 "upcoming": {
-                    "count": upcoming_count,
-                    "leads": LeadSerializer(upcoming_leads, many=True).data,
+                    "count": reminder_counts["upcoming"],
+                    "leads": serialized_leads["upcoming"],
                 },
                 "done": {
-                    "count": done_count,
+                    "count": reminder_counts["done"],
                     "leads": [],  # Don't return done leads to reduce payload
                 },
             },
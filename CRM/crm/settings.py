@@ -91,6 +91,13 @@ MIDDLEWARE = [
     "common.middleware.get_company.GetProfile",
 ]
 
+# Development only: log (or with QUERY_BUDGET_STRICT fail) requests that run
+# more queries than their view's query_budget
+QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", "10"))
+QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "0").lower() in ("1", "true", "yes")
+if DEBUG:
+    MIDDLEWARE.append("common.middleware.query_budget.QueryBudget")
+
 ROOT_URLCONF = "crm.urls"
 
 TEMPLATES = [
@@ -136,6 +143,9 @@ if DATABASE_URL:
                 "connect_timeout": 10,
                 "sslmode": "require",
             }
+            # The pooler runs in transaction mode, which can't keep named cursors
+            # open for QuerySet.iterator()
+            db_config["DISABLE_SERVER_SIDE_CURSORS"] = True
         DATABASES = {"default": db_config}
     except Exception as e:
         print(f"Error parsing DATABASE_URL: {e}")
@@ -169,6 +179,38 @@ else:
         }
     }
 
+# Threads per process that run_concurrently() spreads independent reads over.
+# Each thread holds its own DB connection: with CONN_MAX_AGE > 0 that is up to
+# this many extra persistent connections per gunicorn worker, and with
+# CONN_MAX_AGE=0 every task opens a new one, which can cost more than the
+# lookups it overlaps. 0 (the default) runs the reads one after another on the
+# request's own connection; only raise it when a pooler absorbs the connections.
+ORM_READ_THREADS = int(os.getenv("ORM_READ_THREADS", "0"))
+
+# Cache: Redis when CACHE_BACKEND=redis (shared across workers), else per-process local memory.
+# RedisCache needs the redis package (requirements.txt); CACHE_URL falls back to
+# REDIS_URL, which hosted Redis add-ons usually set
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "locmem").lower()
+if CACHE_BACKEND == "redis":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("CACHE_URL") or os.getenv("REDIS_URL", "redis://localhost:6379/2"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Cached reminders, user lists, dropdown options and profiles are dropped by
+# model signals, which only reach other workers through a shared cache. With
+# the per-process locmem cache those caches are bypassed instead of going
+# stale in every worker but the one that handled the change.
+SHARED_CACHE = CACHE_BACKEND == "redis"
+
 
 # Password validation
 # https://docs.djangoproject.com/en/1.10/ref/settings/#auth-password-validators
@@ -300,7 +342,7 @@ SETTINGS_EXPORT = ["APPLICATION_NAME"]
 REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "rest_framework.views.exception_handler",
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "common.utils.external_auth.ProfileJWTAuthentication",
         "common.utils.external_auth.CustomDualAuthentication"
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
@@ -10,7 +10,7 @@ import datetime
 import json
 
 from leads.models import Lead
-from utils.roles_enum import UserRole
+from utils.roles_enum import ROLE_EMPLOYEE, ROLE_MANAGER
 
 
 class SiteAdminView(LoginRequiredMixin, TemplateView):
@@ -26,7 +26,7 @@ class SiteAdminView(LoginRequiredMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["ROLE_EMPLOYEE_VALUE"] = UserRole.EMPLOYEE.value
+        context["ROLE_EMPLOYEE_VALUE"] = ROLE_EMPLOYEE
 
         # Get user profile and role
         user_profile = self.request.user.profile
@@ -36,7 +36,7 @@ class SiteAdminView(LoginRequiredMixin, TemplateView):
         base_leads_queryset = Lead.objects.none()
         
         # Role-based data filtering
-        if user_role == UserRole.MANAGER.value:
+        if user_role == ROLE_MANAGER:
             base_leads_queryset = Lead.objects.select_related(
                 'status', 'assigned_to', 'assigned_to__user'
             ).filter(is_project=False)
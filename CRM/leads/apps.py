@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class LeadsConfig(AppConfig):
     name = "leads"
+
+    def ready(self):
+        # Register signal handlers
+        from leads import signals  # noqa: F401
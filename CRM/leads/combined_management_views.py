@@ -11,7 +11,12 @@ from rest_framework.permissions import IsAuthenticated
 from django.core.exceptions import PermissionDenied
 from rest_framework.response import Response
 from common.models import LeadStatus, LeadSource, LeadLifecycle
-from utils.roles_enum import UserRole
+from leads.utils.choices import (
+    get_lead_lifecycle_options,
+    get_lead_source_options,
+    get_lead_status_options,
+)
+from utils.roles_enum import ROLE_MANAGER
 
 
 class CombinedManagementView(LoginRequiredMixin, ListView):
@@ -22,7 +27,7 @@ class CombinedManagementView(LoginRequiredMixin, ListView):
     
     def dispatch(self, request, *args, **kwargs):
         # Check if user is a manager
-        if not hasattr(request.user, 'profile') or int(request.user.profile.role) != UserRole.MANAGER.value:
+        if not hasattr(request.user, 'profile') or request.user.profile.role != ROLE_MANAGER:
             raise PermissionDenied("Only managers can access management")
         return super().dispatch(request, *args, **kwargs)
     
@@ -43,7 +48,7 @@ class StatusCreateView(APIView):
     
     def post(self, request):
         # Check if user is a manager
-        if not hasattr(request.user, 'profile') or int(request.user.profile.role) != UserRole.MANAGER.value:
+        if not hasattr(request.user, 'profile') or request.user.profile.role != ROLE_MANAGER:
             return Response({"success": False, "error": "unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         
         # Support both JSON and form data
@@ -90,7 +95,7 @@ class StatusDeleteView(APIView):
 
     def delete(self, request, pk):
         # Check if user is a manager
-        if not hasattr(request.user, 'profile') or int(request.user.profile.role) != UserRole.MANAGER.value:
+        if not hasattr(request.user, 'profile') or request.user.profile.role != ROLE_MANAGER:
             return Response({"success": False, "error": "unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         
         try:
@@ -117,7 +122,7 @@ class SourceCreateView(APIView):
     
     def post(self, request):
         # Check if user is a manager
-        if not hasattr(request.user, 'profile') or int(request.user.profile.role) != UserRole.MANAGER.value:
+        if not hasattr(request.user, 'profile') or request.user.profile.role != ROLE_MANAGER:
             return Response({"success": False, "error": "unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         
         # Support both JSON and form data
@@ -151,7 +156,7 @@ class SourceDeleteView(APIView):
 
     def delete(self, request, pk):
         # Check if user is a manager
-        if not hasattr(request.user, 'profile') or int(request.user.profile.role) != UserRole.MANAGER.value:
+        if not hasattr(request.user, 'profile') or request.user.profile.role != ROLE_MANAGER:
             return Response({"success": False, "error": "unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         
         try:
@@ -178,7 +183,7 @@ class LifecycleCreateView(APIView):
     
     def post(self, request):
         # Check if user is a manager
-        if not hasattr(request.user, 'profile') or int(request.user.profile.role) != UserRole.MANAGER.value:
+        if not hasattr(request.user, 'profile') or request.user.profile.role != ROLE_MANAGER:
             return Response({"success": False, "error": "unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         
         # Support both JSON and form data
@@ -223,7 +228,7 @@ class LifecycleDeleteView(APIView):
 
     def delete(self, request, pk):
         # Check if user is a manager
-        if not hasattr(request.user, 'profile') or int(request.user.profile.role) != UserRole.MANAGER.value:
+        if not hasattr(request.user, 'profile') or request.user.profile.role != ROLE_MANAGER:
             return Response({"success": False, "error": "unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         
         try:
@@ -248,30 +253,7 @@ class LeadoptionsListView(APIView):
 
 
     def get(self, request):
-        statuses = LeadStatus.objects.all().order_by('sort_order', 'name')
-        statuses_data = [
-            {
-                'id': s.id,
-                'name': s.name,
-            }
-            for s in statuses
-        ]
-
-        sources = LeadSource.objects.all().order_by('source')
-        sources_data = [
-            {
-                'id': src.id,
-                'name': src.source,
-            }
-            for src in sources
-        ]
-
-        lifecycles = LeadLifecycle.objects.all().order_by('sort_order', 'name')
-        lifecycles_data = [
-            {
-                'id': lc.id,
-                'name': lc.name,
-            }
-            for lc in lifecycles
-        ]
+        statuses_data = get_lead_status_options()
+        sources_data = get_lead_source_options()
+        lifecycles_data = get_lead_lifecycle_options()
         return Response({'statuses': statuses_data, 'sources': sources_data, 'lifecycles': lifecycles_data}, status=status.HTTP_200_OK)
\ No newline at end of file
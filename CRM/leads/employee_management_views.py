@@ -7,7 +7,7 @@ from django.db.models import Count, Q
 from common.models import Profile, User
 from common.serializer import ProfileSerializer, EmployeeSerializer
 from leads.models import Lead
-from utils.roles_enum import UserRole
+from utils.roles_enum import ROLE_EMPLOYEE, ROLE_MANAGER
 
 
 
@@ -20,19 +20,19 @@ class EmployeeListView(APIView):
         if not hasattr(request.user, 'profile') or request.user.profile is None:
             return Response({"success": False, "error": "unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         
-        user_role = int(request.user.profile.role) if request.user.profile.role is not None else None
-        if user_role != UserRole.MANAGER.value:
+        user_role = request.user.profile.role
+        if user_role != ROLE_MANAGER:
             return Response({"success": False, "error": "unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         
         # Employees (role = EMPLOYEE)
         employees = Profile.objects.filter(
-            role=UserRole.EMPLOYEE.value,
+            role=ROLE_EMPLOYEE,
             user__is_deleted=False
         ).select_related('user').order_by('-created_at')
 
         # Managers (role = MANAGER), exclude current user to avoid duplication
         managers = Profile.objects.filter(
-            role=UserRole.MANAGER.value,
+            role=ROLE_MANAGER,
             user__is_deleted=False
         ).select_related('user').order_by('-created_at')
         
@@ -40,7 +40,7 @@ class EmployeeListView(APIView):
         managers_serializer = EmployeeSerializer(managers, many=True)
         
         # Counts for employees only
-        base_queryset = Profile.objects.filter(role=UserRole.EMPLOYEE.value, user__is_deleted=False)
+        base_queryset = Profile.objects.filter(role=ROLE_EMPLOYEE, user__is_deleted=False)
         counts = base_queryset.aggregate(
             active=Count('id', filter=Q(is_active=True)),
             inactive=Count('id', filter=Q(is_active=False)),
@@ -68,15 +68,15 @@ class EmployeeToggleActiveView(APIView):
         if not hasattr(request.user, 'profile') or request.user.profile is None:
             return Response({"success": False, "error": "unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         
-        user_role = int(request.user.profile.role) if request.user.profile.role is not None else None
-        if user_role != UserRole.MANAGER.value:
+        user_role = request.user.profile.role
+        if user_role != ROLE_MANAGER:
             return Response({"success": False, "error": "unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         
         try:
             profile = get_object_or_404(Profile, pk=pk)
             
             # Don't allow managers to deactivate themselves
-            if profile.user == request.user:
+            if profile.user_id == request.user.id:
                 return Response({"success": False, "error": "cannot_deactivate_self"}, status=status.HTTP_400_BAD_REQUEST)
             
             # Toggle active status
@@ -87,14 +87,14 @@ class EmployeeToggleActiveView(APIView):
             try:
                 from common.tasks import send_email_user_status
                 send_email_user_status(
-                    profile.user.id,
+                    profile.user_id,
                     status_changed_user=request.user.email
                 )
             except Exception as e:
                 # Log the error but don't fail the request
                 import logging
                 logger = logging.getLogger(__name__)
-                logger.error(f"Failed to send status change email for user {profile.user.id}: {str(e)}")
+                logger.error(f"Failed to send status change email for user {profile.user_id}: {str(e)}")
                 # Don't fail the request if email fails
                 pass
             
@@ -123,15 +123,15 @@ class EmployeeDeleteView(APIView):
         if not hasattr(request.user, 'profile') or request.user.profile is None:
             return Response({"success": False, "error": "unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         
-        user_role = int(request.user.profile.role) if request.user.profile.role is not None else None
-        if user_role != UserRole.MANAGER.value:
+        user_role = request.user.profile.role
+        if user_role != ROLE_MANAGER:
             return Response({"success": False, "error": "unauthorized"}, status=status.HTTP_403_FORBIDDEN)
         
         try:
             profile = get_object_or_404(Profile, pk=pk)
             
             # Don't allow managers to delete themselves
-            if profile.user == request.user:
+            if profile.user_id == request.user.id:
                 return Response({"success": False, "error": "cannot_delete_self"}, status=status.HTTP_400_BAD_REQUEST)
             
             # Check if employee has any leads assigned
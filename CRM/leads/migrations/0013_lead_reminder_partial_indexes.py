@@ -0,0 +1,21 @@
+# Generated by Django 4.2.1 on 2026-10-16 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0012_merge_20260120_2046'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('follow_up_at__isnull', False), ('is_active', True)), fields=['follow_up_status', 'follow_up_at'], name='lead_fu_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['assigned_to', 'follow_up_status', 'follow_up_at'], name='lead_fu_assigned_idx'),
+        ),
+    ]
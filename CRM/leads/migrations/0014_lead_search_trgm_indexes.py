@@ -0,0 +1,44 @@
+# Generated by Django 4.2.1 on 2026-10-16 17:40
+
+from django.db import migrations
+
+
+# On PostgreSQL, Django compiles __icontains to UPPER(col::text) LIKE UPPER(%s).
+# Trigram GIN indexes on that exact expression let the lead search use an index
+# instead of scanning the table, without changing the search semantics.
+SEARCH_INDEXES = (
+    ('lead_company_trgm', 'company_name'),
+    ('lead_first_name_trgm', 'contact_first_name'),
+    ('lead_last_name_trgm', 'contact_last_name'),
+    ('lead_email_trgm', 'contact_email'),
+)
+
+
+def create_search_indexes(apps, schema_editor):
+    # pg_trgm is PostgreSQL-only; the SQLite development database keeps scanning
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, column in SEARCH_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON lead '
+            f'USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, _column in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0013_lead_reminder_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, reverse_code=drop_search_indexes),
+    ]
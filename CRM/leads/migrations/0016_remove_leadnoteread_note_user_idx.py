@@ -0,0 +1,17 @@
+# Generated by Django 4.2.1 on 2026-10-16 18:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0015_lead_list_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='leadnoteread',
+            name='lead_note_r_note_id_91081a_idx',
+        ),
+    ]
@@ -1,5 +1,6 @@
 import arrow
 from django.db import models
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import pgettext_lazy
 
@@ -86,6 +87,29 @@ class Lead(BaseModel):
             models.Index(fields=['created_at']),
             models.Index(fields=['status']),
             models.Index(fields=['is_project', 'created_at']),
+            # Reminder buckets only ever look at active leads with a follow-up date
+            models.Index(
+                fields=['follow_up_status', 'follow_up_at'],
+                name='lead_fu_pending_idx',
+                condition=Q(is_active=True, follow_up_at__isnull=False),
+            ),
+            models.Index(
+                fields=['assigned_to', 'follow_up_status', 'follow_up_at'],
+                name='lead_fu_assigned_idx',
+                condition=Q(is_active=True),
+            ),
+            # Lead and project lists: active rows split by is_project, newest first,
+            # optionally narrowed to one assignee
+            models.Index(
+                fields=['is_project', '-created_at'],
+                name='lead_active_created_idx',
+                condition=Q(is_active=True),
+            ),
+            models.Index(
+                fields=['assigned_to', 'is_project', '-created_at'],
+                name='lead_assigned_active_idx',
+                condition=Q(is_active=True),
+            ),
         ]
 
     def __str__(self):
@@ -146,7 +170,7 @@ class Lead(BaseModel):
         # Use prefetched notes if available to avoid additional queries
         if hasattr(self, '_prefetched_notes'):
             # Filter notes sent to user (not by user)
-            notes_sent_to_user = [n for n in self._prefetched_notes if n.author != current_profile]
+            notes_sent_to_user = [n for n in self._prefetched_notes if n.author_id != current_profile.id]
             
             # Check if any note hasn't been read by current user
             # read_by is prefetched, so we can check it efficiently
@@ -226,10 +250,10 @@ class LeadNoteRead(BaseModel):
         verbose_name = "Lead Note Read"
         verbose_name_plural = "Lead Note Reads"
         db_table = "lead_note_reads"
+        # The unique (note, user) index also serves the per-note read lookups
         unique_together = ('note', 'user')
         indexes = [
             models.Index(fields=['user', 'created_at']),
-            models.Index(fields=['note', 'user']),
         ]
     
     def __str__(self):
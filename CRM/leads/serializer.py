@@ -59,6 +59,51 @@ class LeadSerializer(serializers.ModelSerializer):
         )
 
 
+# Columns LeadSerializer renders, for .only() on lead querysets that
+# select_related status, lifecycle, assigned_to__user and created_by
+LEAD_SERIALIZER_ONLY_FIELDS = (
+    "id",
+    "title",
+    "source",
+    "description",
+    "company_name",
+    "contact_first_name",
+    "contact_last_name",
+    "contact_email",
+    "contact_phone",
+    "contact_position_title",
+    "contact_linkedin_url",
+    "follow_up_at",
+    "follow_up_status",
+    "send_reminder_email",
+    "reminder_time_offset",
+    "reminder_email_sent_at",
+    "created_at",
+    "is_active",
+    "always_active",
+    "status__id",
+    "status__name",
+    "status__sort_order",
+    "lifecycle__id",
+    "lifecycle__name",
+    "lifecycle__sort_order",
+    "assigned_to__id",
+    "assigned_to__role",
+    "assigned_to__phone",
+    "assigned_to__alternate_phone",
+    "assigned_to__is_active",
+    "assigned_to__created_at",
+    "assigned_to__updated_at",
+    "assigned_to__user__id",
+    "assigned_to__user__email",
+    "assigned_to__user__is_active",
+    "assigned_to__user__first_name",
+    "assigned_to__user__last_name",
+    "created_by__id",
+    "created_by__email",
+)
+
+
 class LeadCreateSerializer(serializers.ModelSerializer):
     # Override follow_up_status to accept any case variant
     follow_up_status = serializers.CharField(
@@ -586,6 +631,9 @@ class LeadNoteSerializer(serializers.ModelSerializer):
     
     def get_is_read(self, obj):
         """Check if the current user has read this note"""
+        # List views annotate is_read in the notes query; use it when present
+        if getattr(obj, 'is_read', None) is not None:
+            return obj.is_read
         request = self.context.get('request')
         if request and request.user and request.user.is_authenticated:
             return obj.read_by.filter(user=request.user).exists()
@@ -606,6 +654,37 @@ class LeadNoteCreateSerializer(serializers.ModelSerializer):
         return value.strip()
 
 
+class ReminderLeadSerializer(serializers.ModelSerializer):
+    """Flat, lightweight lead representation for reminder lists"""
+    status_name = serializers.CharField(source="status.name", read_only=True)
+    assigned_to_email = serializers.EmailField(source="assigned_to.user.email", read_only=True)
+
+    class Meta:
+        model = Lead
+        fields = (
+            "id",
+            "title",
+            "company_name",
+            "follow_up_at",
+            "follow_up_status",
+            "status_name",
+            "assigned_to_email",
+        )
+
+
+# Columns ReminderLeadSerializer renders, for .only() on querysets that
+# select_related status and assigned_to__user
+REMINDER_LEAD_SERIALIZER_ONLY_FIELDS = (
+    "id",
+    "title",
+    "company_name",
+    "follow_up_at",
+    "follow_up_status",
+    "status__name",
+    "assigned_to__user__email",
+)
+
+
 class ReminderCategorySerializer(serializers.Serializer):
     """Serializer for reminder category (overdue, due_today, upcoming, done)"""
     count = serializers.IntegerField()
@@ -0,0 +1,59 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from common.models import LeadLifecycle, LeadSource, LeadStatus, Profile, User
+from leads.models import Lead
+from leads.utils.cache import (
+    LEAD_LIFECYCLE_OPTIONS_KEY,
+    LEAD_SOURCE_OPTIONS_KEY,
+    LEAD_STATUS_OPTIONS_KEY,
+    invalidate_lead_users_cache,
+    invalidate_reminders_cache,
+)
+
+
+@receiver(post_save, sender=Lead)
+@receiver(post_delete, sender=Lead)
+def lead_changed(sender, instance, **kwargs):
+    """Drop cached reminders whenever a lead is created, updated or deleted"""
+    invalidate_reminders_cache()
+
+
+@receiver(post_save, sender=LeadStatus)
+@receiver(post_delete, sender=LeadStatus)
+def lead_status_changed(sender, instance, **kwargs):
+    """Drop cached status options, and reminders that embed status names"""
+    cache.delete(LEAD_STATUS_OPTIONS_KEY)
+    invalidate_reminders_cache()
+
+
+@receiver(post_save, sender=LeadSource)
+@receiver(post_delete, sender=LeadSource)
+def lead_source_changed(sender, instance, **kwargs):
+    """Drop cached source options"""
+    cache.delete(LEAD_SOURCE_OPTIONS_KEY)
+
+
+@receiver(post_save, sender=LeadLifecycle)
+@receiver(post_delete, sender=LeadLifecycle)
+def lead_lifecycle_changed(sender, instance, **kwargs):
+    """Drop cached lifecycle options, and reminders that embed lifecycle names"""
+    cache.delete(LEAD_LIFECYCLE_OPTIONS_KEY)
+    invalidate_reminders_cache()
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def profile_changed(sender, instance, **kwargs):
+    """Drop cached user lists that embed profile details"""
+    invalidate_lead_users_cache()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, update_fields=None, **kwargs):
+    """Drop cached user lists that embed user details; logins only touch last_login"""
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+    invalidate_lead_users_cache()
@@ -1,4 +1,5 @@
 import re
+import time
 
 from django.conf import settings
 from django.db.models import Q
@@ -162,6 +163,19 @@ def send_email_to_unassigned_user(old_assignee_id, lead_id, new_assignee_id=None
     )
 
 
+def send_reassignment_emails(lead_id, new_assignee_id, old_assignee_id=None):
+    """Email the new assignee of a lead and, if there was one, the old assignee."""
+    send_email_to_assigned_user([new_assignee_id], lead_id, source="reassignment")
+    if old_assignee_id:
+        # Add delay to respect rate limit
+        time.sleep(1)
+        send_email_to_unassigned_user(
+            old_assignee_id,
+            lead_id,
+            new_assignee_id=new_assignee_id
+        )
+
+
 def send_follow_up_reminder_email(lead_id):
     """
     Send follow-up reminder email to assigned user.
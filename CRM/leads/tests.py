@@ -0,0 +1,268 @@
+import uuid
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from common.models import LeadLifecycle, LeadSource, LeadStatus, Profile, User
+from leads.models import Lead, LeadNote
+from leads.views import LeadDetailView, LeadListView
+from utils.roles_enum import ROLE_EMPLOYEE, ROLE_MANAGER
+
+
+# Budgets assume nothing is served from the shared cache and reads run serially
+@override_settings(SHARED_CACHE=False, ORM_READ_THREADS=0)
+class LeadListViewQueryBudgetTest(TestCase):
+    """LeadListView stays within the query_budget the QueryBudget middleware enforces"""
+
+    @classmethod
+    def setUpTestData(cls):
+        manager_user = User.objects.create_user("manager@example.com", "password")
+        employee_user = User.objects.create_user("employee@example.com", "password")
+        cls.manager = Profile.objects.create(user=manager_user, role=ROLE_MANAGER)
+        cls.employee = Profile.objects.create(user=employee_user, role=ROLE_EMPLOYEE)
+        LeadStatus.objects.create(name="Open")
+        LeadSource.objects.create(source="Web")
+        LeadLifecycle.objects.create(name="Cold")
+        for i in range(3):
+            Lead.objects.create(title=f"Lead {i}", is_active=True, assigned_to=cls.employee)
+
+    def get_client(self, profile):
+        client = APIClient()
+        token = RefreshToken.for_user(profile.user).access_token
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return client
+
+    def test_get_within_budget(self):
+        client = self.get_client(self.manager)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get("/api/leads/")
+        self.assertLessEqual(len(queries), LeadListView.query_budget["GET"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 3)
+
+    def test_get_past_last_page_within_budget(self):
+        # An empty page carries no window total, so the count is a separate query
+        client = self.get_client(self.manager)
+        with self.assertNumQueries(LeadListView.query_budget["GET"]):
+            response = client.get("/api/leads/", {"limit": 2, "offset": 10})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["leads"], [])
+        self.assertEqual(response.json()["count"], 3)
+
+    @mock.patch("leads.tasks.send_mailtrap_email")
+    def test_manager_post_within_budget(self, send_mailtrap_email):
+        client = self.get_client(self.manager)
+        with self.assertNumQueries(LeadListView.query_budget["POST"]):
+            response = client.post(
+                "/api/leads/",
+                {"title": "New lead", "assigned_to": str(self.employee.id)},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 201)
+        send_mailtrap_email.assert_called_once()
+
+
+@override_settings(SHARED_CACHE=False, ORM_READ_THREADS=0)
+class LeadDetailViewPatchTest(TestCase):
+    """LeadDetailView stays within its query_budget and renders a new assignee"""
+
+    @classmethod
+    def setUpTestData(cls):
+        manager_user = User.objects.create_user("manager@example.com", "password")
+        old_user = User.objects.create_user("old@example.com", "password")
+        new_user = User.objects.create_user("new@example.com", "password")
+        cls.manager = Profile.objects.create(user=manager_user, role=ROLE_MANAGER)
+        cls.old_assignee = Profile.objects.create(user=old_user, role=ROLE_EMPLOYEE)
+        cls.new_assignee = Profile.objects.create(user=new_user, role=ROLE_EMPLOYEE)
+        cls.lead = Lead.objects.create(title="Lead", is_active=True, assigned_to=cls.old_assignee)
+
+    def setUp(self):
+        self.client = APIClient()
+        token = RefreshToken.for_user(self.manager.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def reassign(self):
+        return self.client.patch(
+            f"/api/leads/{self.lead.id}/",
+            {"title": "Lead", "assigned_to": str(self.new_assignee.id)},
+            format="json",
+        )
+
+    @mock.patch("leads.tasks.send_mailtrap_email")
+    def test_reassignment_renders_new_assignee(self, send_mailtrap_email):
+        with self.assertNumQueries(LeadDetailView.query_budget["PATCH"]):
+            response = self.reassign()
+        self.assertEqual(response.status_code, 200)
+        assigned_to = response.json()["lead"]["assigned_to"]
+        self.assertEqual(assigned_to["id"], str(self.new_assignee.id))
+        self.assertEqual(assigned_to["user_details"]["email"], "new@example.com")
+        self.lead.refresh_from_db()
+        self.assertEqual(self.lead.assigned_to_id, self.new_assignee.id)
+        # Nothing is sent before the update commits
+        send_mailtrap_email.assert_not_called()
+
+    @mock.patch("leads.tasks.send_mailtrap_email")
+    @mock.patch("leads.tasks.time.sleep")
+    @mock.patch("leads.views.run_in_background", side_effect=lambda func, *args, **kwargs: func(*args, **kwargs))
+    def test_reassignment_emails_sent_after_commit(self, run_in_background, sleep, send_mailtrap_email):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.reassign()
+        self.assertEqual(response.status_code, 200)
+        run_in_background.assert_called_once()
+        recipients = [call.kwargs["recipients"] for call in send_mailtrap_email.call_args_list]
+        self.assertEqual(recipients, [["new@example.com"], ["old@example.com"]])
+        sleep.assert_called_once_with(1)
+
+    def test_get_within_budget(self):
+        with self.assertNumQueries(LeadDetailView.query_budget["GET"]):
+            response = self.client.get(f"/api/leads/{self.lead.id}/")
+        self.assertEqual(response.status_code, 200)
+
+    def test_invalid_assignee_keeps_error_message(self):
+        response = self.client.patch(
+            f"/api/leads/{self.lead.id}/",
+            {"title": "Lead", "assigned_to": str(uuid.uuid4())},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(),
+            {"error": True, "message": "Invalid assigned_to profile ID."},
+        )
+
+
+# One process, so locmem behaves like the shared backend the caches require
+@override_settings(
+    SHARED_CACHE=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    ORM_READ_THREADS=0,
+)
+class SharedCacheInvalidationTest(TestCase):
+    """Model signals drop the shared-cache entries the views serve"""
+
+    @classmethod
+    def setUpTestData(cls):
+        manager_user = User.objects.create_user("manager@example.com", "password")
+        employee_user = User.objects.create_user("employee@example.com", "password")
+        cls.manager = Profile.objects.create(user=manager_user, role=ROLE_MANAGER)
+        cls.employee = Profile.objects.create(user=employee_user, role=ROLE_EMPLOYEE)
+        LeadStatus.objects.create(name="Open")
+        Lead.objects.create(title="Lead", is_active=True, assigned_to=cls.employee)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        token = RefreshToken.for_user(self.manager.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_lead_list_served_from_cache(self):
+        self.client.get("/api/leads/")
+        # Only the user and the leads; profile and options come from the cache
+        with self.assertNumQueries(2):
+            response = self.client.get("/api/leads/")
+        self.assertEqual(response.status_code, 200)
+
+    def test_status_options_dropped_on_change(self):
+        self.client.get("/api/leads/")
+        LeadStatus.objects.create(name="Won")
+        response = self.client.get("/api/leads/")
+        names = [option["name"] for option in response.json()["statuses"]]
+        self.assertIn("Won", names)
+
+    def test_reminders_dropped_on_lead_change(self):
+        reminder = {
+            "is_active": True,
+            "follow_up_at": timezone.now() + timedelta(days=2),
+            "follow_up_status": "pending",
+        }
+        Lead.objects.create(title="Call back", **reminder)
+        self.assertEqual(self.client.get("/api/leads/reminders/counts/").json()["upcoming"], 1)
+        Lead.objects.create(title="Call again", **reminder)
+        self.assertEqual(self.client.get("/api/leads/reminders/counts/").json()["upcoming"], 2)
+
+    def test_profile_dropped_on_role_change(self):
+        self.assertEqual(self.client.get("/api/leads/").json()["count"], 1)
+        self.manager.role = ROLE_EMPLOYEE
+        self.manager.save()
+        # Employees only see leads assigned to them
+        self.assertEqual(self.client.get("/api/leads/").json()["count"], 0)
+
+
+class ProfileAuthenticationTest(TestCase):
+    """JWT requests see the user's profile whether or not it is active"""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user("inactive@example.com", "password")
+        cls.profile = Profile.objects.create(user=user, role=ROLE_EMPLOYEE, is_active=False)
+        cls.lead = Lead.objects.create(title="Lead", is_active=True, assigned_to=cls.profile)
+
+    def test_inactive_profile_is_attached(self):
+        client = APIClient()
+        token = RefreshToken.for_user(self.profile.user).access_token
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        response = client.get(f"/api/leads/{self.lead.id}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["lead_obj"]["id"], str(self.lead.id))
+
+
+class LeadNotesPermissionTest(TestCase):
+    """Employees are refused notes of other leads with the repo's error body"""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user("employee@example.com", "password")
+        cls.employee = Profile.objects.create(user=user, role=ROLE_EMPLOYEE)
+        cls.lead = Lead.objects.create(title="Lead", is_active=True)
+        manager_user = User.objects.create_user("manager@example.com", "password")
+        manager = Profile.objects.create(user=manager_user, role=ROLE_MANAGER)
+        cls.note = LeadNote.objects.create(lead=cls.lead, author=manager, message="Note")
+
+    def setUp(self):
+        self.client = APIClient()
+        token = RefreshToken.for_user(self.employee.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def assertRefused(self, response, message):
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json(), {"error": True, "message": message})
+
+    def test_notes_of_unassigned_lead(self):
+        url = f"/api/leads/{self.lead.id}/notes/"
+        self.assertRefused(
+            self.client.get(url), "You can only view notes for leads assigned to you."
+        )
+        self.assertRefused(
+            self.client.post(url, {"message": "Note"}, format="json"),
+            "You can only create notes for leads assigned to you.",
+        )
+        self.assertRefused(
+            self.client.get(f"{url}unread/"),
+            "You can only view unread notes for leads assigned to you.",
+        )
+
+    def test_note_of_unassigned_lead(self):
+        self.assertRefused(
+            self.client.get(f"/api/leads/{self.lead.id}/notes/{self.note.id}/"),
+            "You can only view notes for leads assigned to you.",
+        )
+
+    def test_mark_read_of_unassigned_lead(self):
+        self.assertRefused(
+            self.client.post(f"/api/leads/{self.lead.id}/notes/mark-read/"),
+            "You can only mark notes as read for leads assigned to you.",
+        )
+
+    def test_mark_read_of_assigned_lead(self):
+        lead = Lead.objects.create(title="Mine", is_active=True, assigned_to=self.employee)
+        LeadNote.objects.create(lead=lead, author=self.note.author, message="Note")
+        url = f"/api/leads/{lead.id}/notes/mark-read/"
+        self.assertEqual(self.client.post(url).json()["marked_count"], 1)
+        self.assertEqual(self.client.post(url).json()["marked_count"], 0)
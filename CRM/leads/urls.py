@@ -7,7 +7,10 @@ urlpatterns = [
     path("", views.LeadListView.as_view()),
     path("projects/", views.ProjectListView.as_view(), name="api_projects"),
     path("reminders/", views.RemindersListView.as_view(), name="api_reminders"),
+    path("reminders/counts/", views.RemindersCountsView.as_view(), name="api_reminders_counts"),
+    path("reminders/<str:bucket>/", views.RemindersBucketListView.as_view(), name="api_reminders_bucket"),
     path("options/", views.OptionsView.as_view(), name="api_options"),
+    path("notes/unread/", views.LeadNotesUnreadBulkView.as_view(), name="api_lead_notes_unread_bulk"),
     path("<str:pk>/", views.LeadDetailView.as_view()),
     path("<str:pk>/lifecycle/", views.LeadLifecycleUpdateView.as_view(), name="api_lead_lifecycle"),
     path("<str:pk>/convert-to-project/", views.LeadConvertToProjectView.as_view(), name="api_lead_convert_to_project"),
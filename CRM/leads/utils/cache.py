@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.core.cache import cache
+
+
+# Everything here is invalidated by model signals, which only reach other
+# workers when the cache is shared; callers skip these caches unless
+# settings.SHARED_CACHE is set.
+
+# Reminders tolerate a little staleness; keep the window short
+REMINDERS_CACHE_TIMEOUT = 45
+
+# Bumped on every Lead change so all cached reminder payloads go stale at once
+REMINDERS_VERSION_KEY = "reminders:version"
+
+# Dropdown options only change through the admin; signals clear them on change
+# (in every worker only with a shared cache)
+LEAD_OPTIONS_CACHE_TIMEOUT = 60 * 60
+LEAD_STATUS_OPTIONS_KEY = "lead:options:statuses"
+LEAD_SOURCE_OPTIONS_KEY = "lead:options:sources"
+LEAD_LIFECYCLE_OPTIONS_KEY = "lead:options:lifecycles"
+
+# Users listed next to leads embed profile and user details; bumped on any
+# Profile or User change (seen by every worker only with a shared cache)
+LEAD_USERS_CACHE_TIMEOUT = 5 * 60
+LEAD_USERS_VERSION_KEY = "lead:users:version"
+
+
+def get_or_set_shared(key, default, timeout):
+    """
+    cache.get_or_set() for entries that signals invalidate. Without a shared
+    cache (settings.SHARED_CACHE) the invalidation would not reach the other
+    workers, so default() is computed on every call instead.
+    """
+    if not settings.SHARED_CACHE:
+        return default()
+    return cache.get_or_set(key, default, timeout)
+
+
+def get_reminders_cache_key(scope, day, variant=""):
+    """
+    Cache key for a reminders payload on a given day.
+    scope names whose reminders it holds (one employee, or everyone);
+    variant distinguishes differently shaped payloads, e.g. paginated pages.
+    """
+    version = cache.get_or_set(REMINDERS_VERSION_KEY, 1, None)
+    return f"reminders:v{version}:{scope}:{day.isoformat()}:{variant}"
+
+
+def _bump_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Version key was evicted or never set
+        cache.set(key, 1, None)
+
+
+def invalidate_reminders_cache():
+    """Make every cached reminders payload stale"""
+    _bump_version(REMINDERS_VERSION_KEY)
+
+
+def get_lead_users_cache_key(scope):
+    """Cache key for the users listed next to leads; scope as for reminders"""
+    version = cache.get_or_set(LEAD_USERS_VERSION_KEY, 1, None)
+    return f"lead:users:v{version}:{scope}"
+
+
+def invalidate_lead_users_cache():
+    """Make every cached users list stale"""
+    _bump_version(LEAD_USERS_VERSION_KEY)
@@ -1,3 +1,15 @@
+from leads.utils.cache import (
+    LEAD_LIFECYCLE_OPTIONS_KEY,
+    LEAD_OPTIONS_CACHE_TIMEOUT,
+    LEAD_SOURCE_OPTIONS_KEY,
+    LEAD_STATUS_OPTIONS_KEY,
+    LEAD_USERS_CACHE_TIMEOUT,
+    get_lead_users_cache_key,
+    get_or_set_shared,
+)
+from utils.roles_enum import ROLE_EMPLOYEE, ROLE_MANAGER
+
+
 def get_lead_status_choices():
     from common.models import LeadStatus
 
@@ -19,4 +31,137 @@ def get_lead_source_choices():
     )
     choices = [(source, source) for source in sources]
     
-    return choices
\ No newline at end of file
+    return choices
+
+def get_lead_status_options():
+    """Return lead statuses as [{'id', 'name'}] dicts for dropdowns"""
+    from common.models import LeadStatus
+
+    return get_or_set_shared(
+        LEAD_STATUS_OPTIONS_KEY,
+        lambda: list(
+            LeadStatus.objects.order_by("sort_order", "name").values("id", "name")
+        ),
+        LEAD_OPTIONS_CACHE_TIMEOUT,
+    )
+
+
+def get_lead_source_options():
+    """Return lead sources as [{'id', 'name'}] dicts for dropdowns"""
+    from django.db.models import F
+    from common.models import LeadSource
+
+    return get_or_set_shared(
+        LEAD_SOURCE_OPTIONS_KEY,
+        lambda: list(
+            LeadSource.objects.order_by("source").values("id", name=F("source"))
+        ),
+        LEAD_OPTIONS_CACHE_TIMEOUT,
+    )
+
+
+def get_lead_lifecycle_options():
+    """Return lead lifecycles as [{'id', 'name'}] dicts for dropdowns"""
+    from common.models import LeadLifecycle
+
+    return get_or_set_shared(
+        LEAD_LIFECYCLE_OPTIONS_KEY,
+        lambda: list(
+            LeadLifecycle.objects.order_by("sort_order", "name").values("id", "name")
+        ),
+        LEAD_OPTIONS_CACHE_TIMEOUT,
+    )
+
+
+def get_lead_user_options(user):
+    """
+    Return ProfileSerializer data for the users listed next to leads:
+    everyone for managers, otherwise the user and the managers
+    """
+    from django.db.models import Q
+    from common.models import Profile
+    from common.serializer import PROFILE_SERIALIZER_ONLY_FIELDS, ProfileSerializer
+
+    if user.profile.role == ROLE_MANAGER or user.is_superuser:
+        scope = "all"
+        users = Profile.objects.filter(
+            is_active=True,
+            user__is_deleted=False
+        )
+    else:
+        scope = f"profile:{user.profile.id}"
+        users = Profile.objects.filter(
+            Q(user=user) |
+            Q(role=ROLE_MANAGER),
+            user__is_deleted=False,
+            is_active=True
+        )
+    # The user JOIN feeds user_details; skip the columns nobody renders (password etc.)
+    users = users.select_related('user').only(*PROFILE_SERIALIZER_ONLY_FIELDS)
+
+    return get_or_set_shared(
+        get_lead_users_cache_key(scope),
+        lambda: list(ProfileSerializer(users, many=True).data),
+        LEAD_USERS_CACHE_TIMEOUT,
+    )
+
+
+def get_lead_assignee_options(user):
+    """
+    Return EmployeeSerializer data for the lead detail assignee picker:
+    everyone for managers, otherwise the user and the managers
+    """
+    from django.db.models import Q
+    from common.models import Profile
+    from common.serializer import PROFILE_SERIALIZER_ONLY_FIELDS, EmployeeSerializer
+
+    if user.profile.role == ROLE_MANAGER:
+        scope = "assignees:all"
+        employees = Profile.objects.filter(
+            user__is_deleted=False,
+            is_active=True
+        ).order_by('-created_at')
+    else:
+        scope = f"assignees:profile:{user.profile.id}"
+        employees = Profile.objects.filter(
+            Q(user=user) |
+            Q(role=ROLE_MANAGER),
+            user__is_deleted=False,
+            is_active=True
+        )
+    employees = employees.select_related('user').only(*PROFILE_SERIALIZER_ONLY_FIELDS)
+
+    return get_or_set_shared(
+        get_lead_users_cache_key(scope),
+        lambda: list(EmployeeSerializer(employees, many=True).data),
+        LEAD_USERS_CACHE_TIMEOUT,
+    )
+
+
+def get_lead_employee_options(user):
+    """
+    Return EmployeeSerializer data for the options endpoint: every active
+    user for managers, only employees otherwise
+    """
+    from common.models import Profile
+    from common.serializer import PROFILE_SERIALIZER_ONLY_FIELDS, EmployeeSerializer
+
+    users = Profile.objects.filter(
+        is_active=True,
+        user__is_active=True,
+        user__is_deleted=False,
+    )
+    if user.profile.role == ROLE_MANAGER:
+        scope = "employees:manager"
+    else:
+        scope = "employees:employee"
+        users = users.filter(role=ROLE_EMPLOYEE)
+    users = users.select_related('user').only(
+        *PROFILE_SERIALIZER_ONLY_FIELDS
+    ).order_by('user__first_name', 'user__last_name')
+
+    return get_or_set_shared(
+        get_lead_users_cache_key(scope),
+        lambda: list(EmployeeSerializer(users, many=True).data),
+        LEAD_USERS_CACHE_TIMEOUT,
+    )
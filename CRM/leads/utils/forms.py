@@ -1,6 +1,6 @@
 from django import forms
 from leads.models import Lead
-from utils.roles_enum import UserRole
+from utils.roles_enum import ROLE_EMPLOYEE, ROLE_MANAGER
 
 email_regex = r"^[_a-zA-Z0-9-]+(\.[_a-zA-Z0-9-]+)*@[a-zA-Z0-9-]+(\.[a-zA-Z0-9-]+)*(\.[a-zA-Z]{2,4})$"
 
@@ -55,11 +55,11 @@ class LeadCreateForm(forms.ModelForm):
             # Check if this is an edit form (instance exists)
             is_edit = kwargs.get('instance') is not None
             
-            if int(request.user.profile.role) == UserRole.MANAGER.value:
+            if request.user.profile.role == ROLE_MANAGER:
                 # Manager can assign to any employee OR to themselves during creation and editing
                 # Optimize: Use select_related to avoid N+1 queries
                 employee_choices = Profile.objects.select_related('user').filter(
-                    role=UserRole.EMPLOYEE.value,
+                    role=ROLE_EMPLOYEE,
                     is_active=True,
                     user__is_deleted=False
                 ).values_list('id', 'user__first_name', 'user__email')
@@ -87,12 +87,12 @@ class LeadCreateForm(forms.ModelForm):
                 # Ensure the field is not disabled
                 self.fields['assigned_to'].disabled = False
                 self.fields['assigned_to'].required = False
-            elif int(request.user.profile.role) == UserRole.EMPLOYEE.value:
+            elif request.user.profile.role == ROLE_EMPLOYEE:
                 if is_edit:
                     # Employee can only reassign to manager during editing
                     # Optimize: Use select_related to avoid N+1 queries
                     manager_choices = Profile.objects.select_related('user').filter(
-                        role=UserRole.MANAGER.value,
+                        role=ROLE_MANAGER,
                         is_active=True,
                         user__is_deleted=False
                     ).values_list('id', 'user__first_name', 'user__email')
@@ -0,0 +1,63 @@
+import base64
+import binascii
+import uuid
+
+from django.db.models import Case, CharField, Q, Value, When
+from django.utils.dateparse import parse_datetime
+
+
+REMINDER_BUCKETS = ("overdue", "due_today", "upcoming", "done")
+
+# Rows fetched and serialized at a time when building the full reminders payload
+REMINDERS_CHUNK_SIZE = 500
+
+# Bounds for ?page_size= on the reminders endpoints
+REMINDERS_DEFAULT_PAGE_SIZE = 20
+REMINDERS_MAX_PAGE_SIZE = 100
+
+
+def get_reminder_bucket_filters(today_start, today_end):
+    """Return {bucket: Q} for the reminder buckets relative to today"""
+    return {
+        # Overdue: follow_up_at is in the past and status is 'pending'
+        "overdue": Q(follow_up_status="pending", follow_up_at__lt=today_start),
+        # Due today: follow_up_at is today and status is 'pending'
+        "due_today": Q(
+            follow_up_status="pending",
+            follow_up_at__gte=today_start,
+            follow_up_at__lt=today_end,
+        ),
+        # Upcoming: follow_up_at is in the future (after today) and status is 'pending'
+        "upcoming": Q(follow_up_status="pending", follow_up_at__gte=today_end),
+        # Done: follow_up_status is 'done'
+        "done": Q(follow_up_status="done"),
+    }
+
+
+def get_reminder_bucket_expression(today_start, today_end):
+    """Case expression naming the bucket a lead's reminder falls in"""
+    filters = get_reminder_bucket_filters(today_start, today_end)
+    return Case(
+        *(When(filters[name], then=Value(name)) for name in REMINDER_BUCKETS),
+        output_field=CharField(),
+    )
+
+
+def encode_reminder_cursor(lead):
+    """Opaque cursor pointing just past the given lead"""
+    raw = f"{lead.follow_up_at.isoformat()}|{lead.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_reminder_cursor(cursor):
+    """Return (follow_up_at, lead_id) from a cursor, or None if it is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        follow_up_at, lead_id = raw.split("|", 1)
+        follow_up_at = parse_datetime(follow_up_at)
+        lead_id = uuid.UUID(lead_id)
+    except (binascii.Error, UnicodeError, ValueError):
+        return None
+    if follow_up_at is None:
+        return None
+    return follow_up_at, lead_id
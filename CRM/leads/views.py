@@ -1,7 +1,14 @@
-from django.db.models import Q
+import uuid
+from functools import partial
+from itertools import islice
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.db.models import BooleanField, Count, Exists, OuterRef, Prefetch, Q, Value
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from datetime import timedelta
 
 from rest_framework import status, serializers
 from rest_framework.pagination import LimitOffsetPagination
@@ -9,26 +16,54 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from common.models import LeadSource, LeadStatus, LeadLifecycle, Profile
-from common.serializer import EmployeeSerializer, ProfileSerializer
+from common.models import LeadLifecycle, Profile
+from common.utils.concurrency import run_concurrently, run_in_background
+from common.utils.dates import get_today_bounds
+from common.utils.pagination import WindowCountLimitOffsetPagination
+from common.utils.permissions import HasProfile, IsLeadOwnerOrManager, IsManager
+from common.utils.renderers import ORJSONRenderer
 from .models import Lead, LeadNote, LeadNoteRead
 from leads.serializer import (
+    LEAD_SERIALIZER_ONLY_FIELDS,
+    REMINDER_LEAD_SERIALIZER_ONLY_FIELDS,
     LeadCreateSerializer,
     LeadSerializer,
     LeadNoteSerializer,
     LeadNoteCreateSerializer,
+    ReminderLeadSerializer,
     RemindersResponseSerializer,
 )
-from utils.roles_enum import UserRole
+from leads.utils.cache import REMINDERS_CACHE_TIMEOUT, get_reminders_cache_key
+from leads.utils.choices import (
+    get_lead_lifecycle_options,
+    get_lead_source_options,
+    get_lead_assignee_options,
+    get_lead_employee_options,
+    get_lead_status_options,
+    get_lead_user_options,
+)
+from leads.utils.reminders import (
+    REMINDER_BUCKETS,
+    REMINDERS_CHUNK_SIZE,
+    REMINDERS_DEFAULT_PAGE_SIZE,
+    REMINDERS_MAX_PAGE_SIZE,
+    decode_reminder_cursor,
+    encode_reminder_cursor,
+    get_reminder_bucket_expression,
+    get_reminder_bucket_filters,
+)
+from utils.roles_enum import ROLE_EMPLOYEE, ROLE_MANAGER, UserRole
 
 
-class LeadListView(APIView, LimitOffsetPagination):
+class LeadListView(APIView, WindowCountLimitOffsetPagination):
     """
     API View for listing and creating leads.
     
     GET: Returns all leads with role-based filtering
         - Employees: Only see leads assigned to them
         - Managers: See all leads
+        - Optional ?limit=&offset= return one page instead, and the response
+          then also carries limit and offset (count stays the total)
     
     POST: Creates a new lead
         - Anyone can create leads
@@ -37,6 +72,13 @@ class LeadListView(APIView, LimitOffsetPagination):
     """
     model = Lead
     permission_classes = (IsAuthenticated,)
+    # Counted with authentication (user and profile) and with run_concurrently
+    # running serially. GET: leads (with their count), statuses, sources,
+    # lifecycles and users, plus a COUNT when ?offset= is past the last lead
+    # and no row carries the window total. POST by a manager: assignee,
+    # duplicate title check and insert, then three more for the assignment
+    # email. leads.tests pins both worst cases.
+    query_budget = {"GET": 8, "POST": 8}
 
     def get_queryset(self):
         """
@@ -56,15 +98,17 @@ class LeadListView(APIView, LimitOffsetPagination):
             )
             .filter(is_active=True, is_project=False)  # Only active leads, exclude projects
             .order_by("-created_at")
+            # Only the columns LeadSerializer renders
+            .only(*LEAD_SERIALIZER_ONLY_FIELDS)
         )
         
         # Role-based filtering
         if request.user.is_authenticated and hasattr(request.user, 'profile'):
             user_profile = request.user.profile
-            user_role = int(user_profile.role) if user_profile.role is not None else None
+            user_role = user_profile.role
             
             # Employees can only see leads assigned to them
-            if user_role == UserRole.EMPLOYEE.value:
+            if user_role == ROLE_EMPLOYEE:
                 queryset = queryset.filter(assigned_to=user_profile)
             # Managers can see all leads (no additional filter needed)
         
@@ -77,102 +121,77 @@ class LeadListView(APIView, LimitOffsetPagination):
         # Get base queryset with role-based filtering
         queryset = self.get_queryset()
         
+        # Read each search param once
+        name = params.get("name")
+        city = params.get("city")
+        email = params.get("email")
+        status_id = params.get("status")
+        source = params.get("source")
+        assigned_to = params.get("assigned_to")
+        search = any((name, city, email, status_id, source, assigned_to))
+
         # Apply search filters
-        if params:
-            if params.get("name"):
+        if search:
+            if name:
                 queryset = queryset.filter(
-                    Q(company_name__icontains=params.get("name"))
-                    | Q(contact_first_name__icontains=params.get("name"))
-                    | Q(contact_last_name__icontains=params.get("name"))
+                    Q(company_name__icontains=name)
+                    | Q(contact_first_name__icontains=name)
+                    | Q(contact_last_name__icontains=name)
                 )
-            if params.get("city"):
+            if city:
                 queryset = queryset.filter(
-                    Q(company_name__icontains=params.get("city"))
+                    Q(company_name__icontains=city)
                 )
-            if params.get("email"):
+            if email:
                 queryset = queryset.filter(
-                    contact_email__icontains=params.get("email")
+                    contact_email__icontains=email
                 )
-            if params.get("status"):
-                queryset = queryset.filter(status=params.get("status"))
-            if params.get("source"):
-                queryset = queryset.filter(source=params.get("source"))
-            if params.get("assigned_to"):
-                queryset = queryset.filter(assigned_to=params.get("assigned_to"))
+            if status_id:
+                queryset = queryset.filter(status=status_id)
+            if source:
+                queryset = queryset.filter(source=source)
+            if assigned_to:
+                queryset = queryset.filter(assigned_to=assigned_to)
 
         context = {}
-        search = False
-        if (
-            params.get("name")
-            or params.get("city")
-            or params.get("email")
-            or params.get("status")
-            or params.get("source")
-            or params.get("assigned_to")
-        ):
-            search = True
-        count = queryset.count()
-
-
-
-        
-        #statuses, sources and lifecycles along with lead data
-
-        statuses = LeadStatus.objects.all().order_by('sort_order', 'name')
-        statuses_data = [
-            {
-                'id': s.id,
-                'name': s.name,
-            }
-            for s in statuses
-        ]
-        
-
-        sources = LeadSource.objects.all().order_by('source')
-        sources_data = [
-            {
-                'id': src.id,
-                'name': src.source,
-            }
-            for src in sources
-        ]
-
-        lifecycles = LeadLifecycle.objects.all().order_by('sort_order', 'name')
-        lifecycles_data = [
-            {
-                'id': lc.id,
-                'name': lc.name,
-            }
-            for lc in lifecycles
-        ]
-
-
-        # Employees along with leads data
-
-        if int(self.request.user.profile.role) == UserRole.MANAGER.value or self.request.user.is_superuser:
-            users = Profile.objects.select_related('user').filter(
-                is_active=True,
-                user__is_deleted=False
-            )
 
-            users = users
+        # Without ?limit= every lead is returned, so the count is just the number
+        # of rows fetched; with it, the page query also carries the total via a window
+        paginate = self.limit_query_param in params
+        if paginate:
+            fetch_leads = partial(self.paginate_queryset, queryset, request, view=self)
         else:
-            users = Profile.objects.filter(
-                Q(user=request.user) |
-                Q(role=UserRole.MANAGER.value),
-                user__is_deleted=False,
-                is_active=True
-            ).select_related('user')
-        
-        users = ProfileSerializer(users, many=True).data
+            fetch_leads = partial(list, queryset)
+
+        # Leads, statuses, sources, lifecycles and users are independent
+        # reads: run them concurrently so latency is the slowest one, not the sum
+        (
+            leads,
+            statuses_data,
+            sources_data,
+            lifecycles_data,
+            users_data,
+        ) = run_concurrently(
+            fetch_leads,
+            get_lead_status_options,
+            get_lead_source_options,
+            get_lead_lifecycle_options,
+            # Employees along with leads data
+            partial(get_lead_user_options, request.user),
+        )
 
         context["statuses"] = statuses_data
         context["sources"] = sources_data
         context["lifecycles"] = lifecycles_data
-        context["leads"] = LeadSerializer(queryset, many=True).data
-        context["count"] = count
+        context["leads"] = LeadSerializer(leads, many=True).data
+        if paginate:
+            context["count"] = self.count
+            context["limit"] = self.limit
+            context["offset"] = self.offset
+        else:
+            context["count"] = len(leads)
         context["search"] = search
-        context["users"] = users
+        context["users"] = users_data
 
         return context
 
@@ -196,7 +215,7 @@ class LeadListView(APIView, LimitOffsetPagination):
             )
         
         user_profile = request.user.profile
-        user_role = int(user_profile.role) if user_profile.role is not None else None
+        user_role = user_profile.role
         
         # Prepare data (exclude CSRF token and other non-model fields)
         data = {}
@@ -205,20 +224,22 @@ class LeadListView(APIView, LimitOffsetPagination):
                 data[key] = value
         
         # Role-based assignment validation
+        assignee = None
         if data.get("assigned_to"):
             try:
-                assigned_to = Profile.objects.select_related('user').get(id=data.get("assigned_to"))
+                # Loaded once with its user: validated here, then saved on the
+                # lead and rendered in the response without further queries
+                assignee = Profile.objects.select_related('user').get(id=data.get("assigned_to"))
                 
                 # Employees can only assign to themselves
-                if user_role == UserRole.EMPLOYEE.value:
-                    if assigned_to.id != user_profile.id:
+                if user_role == ROLE_EMPLOYEE:
+                    if assignee.id != user_profile.id:
                         return Response(
                             {"error": True, "message": "You can only assign leads to yourself."},
                             status=status.HTTP_403_FORBIDDEN,
                         )
                 
                 # Managers can assign to any employee
-                data["assigned_to"] = assigned_to.id
             except Profile.DoesNotExist:
                 return Response(
                     {"error": True, "message": "Invalid assigned_to profile ID."},
@@ -226,8 +247,13 @@ class LeadListView(APIView, LimitOffsetPagination):
                 )
         else:
             # If no assignment specified, employees are auto-assigned to themselves
-            if user_role == UserRole.EMPLOYEE.value:
-                data["assigned_to"] = user_profile.id
+            if user_role == ROLE_EMPLOYEE:
+                assignee = user_profile
+
+        # The assignee is passed to save() as an instance, so the serializer's
+        # primary key field does not look the profile up again
+        if assignee is not None:
+            data.pop("assigned_to", None)
 
         # Set defaults for new leads
         if "is_active" not in data:
@@ -236,33 +262,33 @@ class LeadListView(APIView, LimitOffsetPagination):
         # Validate and create lead
         serializer = LeadCreateSerializer(data=data)
         if serializer.is_valid():
+            save_kwargs = {}
+            if assignee is not None:
+                save_kwargs["assigned_to"] = assignee
+            # Reset reminder_email_sent_at if follow_up_at is set with reminder enabled
+            if data.get("follow_up_at") and data.get("send_reminder_email"):
+                save_kwargs["reminder_email_sent_at"] = None
+
+            # A single save stores the lead together with its assignment
             lead_obj = serializer.save(
                 created_by=request.user,
+                **save_kwargs,
             )
 
-            # Reset reminder_email_sent_at if follow_up_at is set with reminder enabled
-            if data.get("follow_up_at") and data.get("send_reminder_email"):
-                lead_obj.reminder_email_sent_at = None
-                lead_obj.save(update_fields=["reminder_email_sent_at"])
-
-            # Handle assignment
-            if data.get("assigned_to"):
-                assigned_to = Profile.objects.select_related('user').get(id=data.get("assigned_to"))
-                lead_obj.assigned_to = assigned_to
-                lead_obj.save()
-                
-                # Send email to assigned employee(s) when lead is created by manager
-                if user_role == UserRole.MANAGER.value or request.user.is_superuser:
-                    try:
-                        from leads.tasks import send_email_to_assigned_user
-                        send_email_to_assigned_user(
-                            [assigned_to.id],
-                            lead_obj.id,
-                            source="lead_creation"
-                        )
-                    except Exception:
-                        # Don't fail the request if email fails
-                        pass
+            # Send email to assigned employee(s) when lead is created by manager
+            if assignee is not None and (
+                user_role == ROLE_MANAGER or request.user.is_superuser
+            ):
+                try:
+                    from leads.tasks import send_email_to_assigned_user
+                    send_email_to_assigned_user(
+                        [lead_obj.assigned_to_id],
+                        lead_obj.id,
+                        source="lead_creation"
+                    )
+                except Exception:
+                    # Don't fail the request if email fails
+                    pass
 
             # Return the created lead with full details
             lead_serializer = LeadSerializer(lead_obj)
@@ -281,12 +307,18 @@ class LeadListView(APIView, LimitOffsetPagination):
 
 class LeadDetailView(APIView):
     model = Lead
-    permission_classes = (IsAuthenticated,)
+    # GET never checks object permissions; PATCH does once the profile is known
+    permission_classes = (IsAuthenticated, IsLeadOwnerOrManager)
+    # Counted like LeadListView. GET: lead, statuses, sources, lifecycles and
+    # employees. PATCH by a manager reassigning the lead: lead, duplicate
+    # title check, assignee, update and the reload for the response; the
+    # reassignment emails run after the response. leads.tests pins both numbers.
+    query_budget = {"GET": 7, "PATCH": 7}
 
     def get_object(self, pk):
         # Optimize: Use select_related
         return get_object_or_404(
-            Lead.objects.select_related('status', 'lifecycle', 'assigned_to', 'assigned_to__user'),
+            Lead.objects.select_related('status', 'lifecycle', 'assigned_to', 'assigned_to__user', 'created_by'),
             pk=pk
         )
 
@@ -298,54 +330,13 @@ class LeadDetailView(APIView):
         lead_obj = self.get_object(pk)
 
         #statuses, sources and lifecycles options
-        statuses = LeadStatus.objects.all().order_by('sort_order', 'name')
-        statuses_data = [
-            {
-                'id': s.id,
-                'name': s.name,
-            }
-            for s in statuses
-        ]
-
-        sources = LeadSource.objects.all().order_by('source')
-        sources_data = [
-            {
-                'id': src.id,
-                'name': src.source,
-            }
-            for src in sources
-        ]
+        statuses_data = get_lead_status_options()
+        sources_data = get_lead_source_options()
+        lifecycles_data = get_lead_lifecycle_options()
 
-        lifecycles = LeadLifecycle.objects.all().order_by('sort_order', 'name')
-        lifecycles_data = [
-            {
-                'id': lc.id,
-                'name': lc.name,
-            }
-            for lc in lifecycles
-        ]
-
-
-        # Employees
-
-        # Check if user is a manager
-        user_role = int(request.user.profile.role) if request.user.profile.role is not None else None
-        if user_role == UserRole.MANAGER.value:       
-            # Get all profiles except the current user (only non-deleted)
-            employees = Profile.objects.filter(
-                user__is_deleted=False,
-                is_active=True
-            ).select_related('user').order_by('-created_at')
-        else:
-            employees = Profile.objects.filter(
-                Q(user=request.user) |
-                Q(role=UserRole.MANAGER.value),
-                user__is_deleted=False,
-                is_active=True
-            ).select_related('user')
 
-        # Serialize employees with flat structure
-        serializer = EmployeeSerializer(employees, many=True)
+        # Employees, serialized with flat structure
+        employees_data = get_lead_assignee_options(request.user)
 
         context = {}
         context["UserRole"] = {role.name: role.value for role in UserRole}
@@ -353,7 +344,7 @@ class LeadDetailView(APIView):
         context["statuses"] = statuses_data
         context["sources"] = sources_data
         context["lifecycles"] = lifecycles_data
-        context["employees"] = serializer.data
+        context["employees"] = employees_data
 
         return Response(context)
 
@@ -373,17 +364,8 @@ class LeadDetailView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        user_profile = request.user.profile
-        user_role = int(user_profile.role) if user_profile.role is not None else None
-        
-        # Role-based permission check
-        if user_role == UserRole.EMPLOYEE.value:
-            # Employees can only update leads assigned to them
-            if lead_obj.assigned_to != user_profile:
-                return Response(
-                    {"error": True, "message": "You can only update leads assigned to you."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        # Employees can only update leads assigned to them
+        self.check_object_permissions(request, lead_obj)
         
         params = request.data
         data = {}
@@ -393,54 +375,36 @@ class LeadDetailView(APIView):
 
         serializer = LeadCreateSerializer(lead_obj, data=data)
         if serializer.is_valid():
-            lead_obj = serializer.save()
+            # Store old assignee before the save changes it
+            old_assignee_id = lead_obj.assigned_to_id
 
+            save_kwargs = {}
             # Reset reminder_email_sent_at if follow_up_at is being updated with reminder enabled
             if data.get("follow_up_at") and data.get("send_reminder_email"):
-                lead_obj.reminder_email_sent_at = None
-                lead_obj.save(update_fields=["reminder_email_sent_at"])
+                save_kwargs["reminder_email_sent_at"] = None
+
+            # assigned_to is a serializer field (validated against Profile),
+            # so this single save also stores the new assignment
+            lead_obj = serializer.save(**save_kwargs)
+
+            # Send emails if assignee changed. They go out once the update is
+            # committed, on a background thread: two sends and the rate-limit
+            # pause between them would otherwise hold up the response
+            if data.get("assigned_to") and lead_obj.assigned_to_id != old_assignee_id:
+                from leads.tasks import send_reassignment_emails
+                transaction.on_commit(partial(
+                    run_in_background,
+                    send_reassignment_emails,
+                    lead_obj.id,
+                    lead_obj.assigned_to_id,
+                    old_assignee_id=old_assignee_id,
+                ))
 
-            # Handle assignment - optimize with select_related
-            if data.get("assigned_to"):
-                # Store old assignee before changing
-                old_assignee = lead_obj.assigned_to
-                
-                try:
-                    assigned_to = Profile.objects.select_related('user').get(id=data.get("assigned_to"))
-                    lead_obj.assigned_to = assigned_to
-                    lead_obj.save()
-                    
-                    # Send emails if assignee changed
-                    if old_assignee != assigned_to:
-                        try:
-                            from leads.tasks import send_email_to_assigned_user, send_email_to_unassigned_user
-                            import time
-                            
-                            # Send email to new assignee
-                            send_email_to_assigned_user(
-                                [assigned_to.id],
-                                lead_obj.id,
-                                source="reassignment"
-                            )
-                            
-                            # Send email to old assignee if they exist
-                            if old_assignee:
-                                # Add delay to respect rate limit
-                                time.sleep(1)
-                                send_email_to_unassigned_user(
-                                    old_assignee.id,
-                                    lead_obj.id,
-                                    new_assignee_id=assigned_to.id
-                                )
-                        except Exception:
-                            # Don't fail the request if email fails
-                            pass
-                            
-                except Profile.DoesNotExist:
-                    return Response(
-                        {"error": True, "message": "Invalid assigned_to profile ID."},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
+            # Reload with the related rows LeadSerializer renders, so a new
+            # assignee is not fetched lazily while serializing
+            lead_obj = Lead.objects.select_related(
+                'status', 'lifecycle', 'assigned_to__user', 'created_by'
+            ).only(*LEAD_SERIALIZER_ONLY_FIELDS).get(pk=lead_obj.pk)
 
             # Return updated lead data
             lead_serializer = LeadSerializer(lead_obj)
@@ -452,6 +416,11 @@ class LeadDetailView(APIView):
                 },
                 status=status.HTTP_200_OK,
             )
+        if "assigned_to" in serializer.errors:
+            return Response(
+                {"error": True, "message": "Invalid assigned_to profile ID."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
         return Response(
             {"error": True, "message": serializer.errors},
             status=status.HTTP_400_BAD_REQUEST,
@@ -477,12 +446,15 @@ class LeadAlwaysActiveUpdateView(APIView):
     
     Accepts: true/false or 1/0 (boolean)
     """
-    permission_classes = (IsAuthenticated,)
+    permission_classes = (IsAuthenticated, HasProfile, IsLeadOwnerOrManager)
+    lead_permission_message = "You can only update always_active status for leads assigned to you."
 
     def get_object(self, pk):
-        """Get lead object with optimizations"""
+        """Get lead object with everything LeadSerializer renders in one query"""
         return get_object_or_404(
-            Lead.objects.select_related('status', 'assigned_to', 'assigned_to__user'),
+            Lead.objects.select_related(
+                'status', 'lifecycle', 'assigned_to__user', 'created_by'
+            ).only(*LEAD_SERIALIZER_ONLY_FIELDS),
             pk=pk
         )
 
@@ -492,25 +464,8 @@ class LeadAlwaysActiveUpdateView(APIView):
         Update always_active status of a lead.
         """
         lead_obj = self.get_object(pk)
-        
-        # Validate user has profile
-        if not hasattr(request.user, 'profile') or request.user.profile is None:
-            return Response(
-                {"error": True, "message": "User profile not found."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        
-        user_profile = request.user.profile
-        user_role = int(user_profile.role) if user_profile.role is not None else None
-        
-        # Role-based permission check
-        if user_role == UserRole.EMPLOYEE.value:
-            # Employees can only update leads assigned to them
-            if lead_obj.assigned_to != user_profile:
-                return Response(
-                    {"error": True, "message": "You can only update always_active status for leads assigned to you."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        # Employees can only act on leads assigned to them
+        self.check_object_permissions(request, lead_obj)
         
         # Get always_active from request data
         always_active = request.data.get("always_active")
@@ -529,6 +484,8 @@ class LeadAlwaysActiveUpdateView(APIView):
         
         # Update the always_active status
         lead_obj.always_active = always_active
+        # save() rather than queryset.update() so post_save still invalidates
+        # the cached reminders; the row is already loaded for the response
         lead_obj.save(update_fields=["always_active"])
         
         # Return updated lead data
@@ -552,12 +509,13 @@ class LeadAssignView(APIView):
         - Only managers can assign leads
         - Sends email notification to newly assigned employee
     """
-    permission_classes = (IsAuthenticated,)
+    permission_classes = (IsAuthenticated, HasProfile)
 
     def get_object(self, pk):
         """Get lead object with optimizations"""
         return get_object_or_404(
-            Lead.objects.select_related('status', 'lifecycle', 'assigned_to', 'assigned_to__user'),
+            # The current assignee is replaced before the lead is serialized, so it is not joined
+            Lead.objects.select_related('status', 'lifecycle', 'created_by'),
             pk=pk
         )
 
@@ -567,16 +525,6 @@ class LeadAssignView(APIView):
         """
         lead_obj = self.get_object(pk)
         
-        # Validate user has profile
-        if not hasattr(request.user, 'profile') or request.user.profile is None:
-            return Response(
-                {"error": True, "message": "User profile not found."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        
-        user_profile = request.user.profile
-        user_role = int(user_profile.role) if user_profile.role is not None else None
-        
         # Get assigned_to from request data
         assigned_to_id = request.data.get("assigned_to")
         
@@ -599,15 +547,15 @@ class LeadAssignView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        # Store old assignee for comparison
-        old_assignee = lead_obj.assigned_to
+        # Store old assignee id for comparison; the old profile itself is never needed
+        old_assignee_id = lead_obj.assigned_to_id
         
         # Update the assignment
         lead_obj.assigned_to = new_assignee
         lead_obj.save(update_fields=["assigned_to"])
         
         # Send email notifications if assignee changed
-        if old_assignee != new_assignee:
+        if old_assignee_id != new_assignee.id:
             try:
                 from leads.tasks import send_email_to_assigned_user, send_email_to_unassigned_user
                 import time
@@ -620,11 +568,11 @@ class LeadAssignView(APIView):
                 )
                 
                 # Send email to old assignee if they exist
-                if old_assignee:
+                if old_assignee_id:
                     # Add delay to respect rate limit
                     time.sleep(1)
                     send_email_to_unassigned_user(
-                        old_assignee.id,
+                        old_assignee_id,
                         lead_obj.id,
                         new_assignee_id=new_assignee.id
                     )
@@ -657,12 +605,13 @@ class LeadFollowUpScheduleView(APIView):
         - Employees can schedule for their assigned leads
         - Managers can schedule for any lead
     """
-    permission_classes = (IsAuthenticated,)
+    permission_classes = (IsAuthenticated, HasProfile, IsLeadOwnerOrManager)
+    lead_permission_message = "You can only schedule follow-ups for leads assigned to you."
 
     def get_object(self, pk):
         """Get lead object with optimizations"""
         return get_object_or_404(
-            Lead.objects.select_related('status', 'lifecycle', 'assigned_to', 'assigned_to__user'),
+            Lead.objects.select_related('status', 'lifecycle', 'assigned_to', 'assigned_to__user', 'created_by'),
             pk=pk
         )
 
@@ -671,25 +620,8 @@ class LeadFollowUpScheduleView(APIView):
         Schedule a follow-up for a lead.
         """
         lead_obj = self.get_object(pk)
-        
-        # Validate user has profile
-        if not hasattr(request.user, 'profile') or request.user.profile is None:
-            return Response(
-                {"error": True, "message": "User profile not found."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        
-        user_profile = request.user.profile
-        user_role = int(user_profile.role) if user_profile.role is not None else None
-        
-        # Role-based permission check
-        if user_role == UserRole.EMPLOYEE.value:
-            # Employees can only schedule for leads assigned to them
-            if lead_obj.assigned_to != user_profile:
-                return Response(
-                    {"error": True, "message": "You can only schedule follow-ups for leads assigned to you."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        # Employees can only act on leads assigned to them
+        self.check_object_permissions(request, lead_obj)
         
         # Get follow-up data from request
         follow_up_at = request.data.get("follow_up_at")
@@ -763,12 +695,13 @@ class LeadLifecycleUpdateView(APIView):
         - Employees can only update leads assigned to them
         - Managers can update any lead
     """
-    permission_classes = (IsAuthenticated,)
+    permission_classes = (IsAuthenticated, HasProfile, IsLeadOwnerOrManager)
+    lead_permission_message = "You can only update lifecycles for leads assigned to you."
 
     def get_object(self, pk):
         """Get lead object with optimizations"""
         return get_object_or_404(
-            Lead.objects.select_related('status', 'assigned_to', 'assigned_to__user', 'lifecycle'),
+            Lead.objects.select_related('status', 'assigned_to', 'assigned_to__user', 'lifecycle', 'created_by'),
             pk=pk
         )
 
@@ -777,24 +710,8 @@ class LeadLifecycleUpdateView(APIView):
         Update lifecycle of a lead.
         """
         lead_obj = self.get_object(pk)
-        
-        # Validate user has profile
-        if not hasattr(request.user, 'profile') or request.user.profile is None:
-            return Response(
-                {"error": True, "message": "User profile not found."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        
-        user_profile = request.user.profile
-        user_role = int(user_profile.role) if user_profile.role is not None else None
-        
-        # Role-based permission check
-        if user_role == UserRole.EMPLOYEE.value:
-            if lead_obj.assigned_to != user_profile:
-                return Response(
-                    {"error": True, "message": "You can only update lifecycles for leads assigned to you."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        # Employees can only act on leads assigned to them
+        self.check_object_permissions(request, lead_obj)
         
         lifecycle_id = request.data.get("lifecycle")
         if not lifecycle_id:
@@ -836,12 +753,15 @@ class LeadFollowUpStatusUpdateView(APIView):
     
     Accepts: 'pending' or 'done' (case-insensitive)
     """
-    permission_classes = (IsAuthenticated,)
+    permission_classes = (IsAuthenticated, HasProfile, IsLeadOwnerOrManager)
+    lead_permission_message = "You can only update follow-up status for leads assigned to you."
 
     def get_object(self, pk):
-        """Get lead object with optimizations"""
+        """Get lead object with everything LeadSerializer renders in one query"""
         return get_object_or_404(
-            Lead.objects.select_related('status', 'assigned_to', 'assigned_to__user'),
+            Lead.objects.select_related(
+                'status', 'lifecycle', 'assigned_to__user', 'created_by'
+            ).only(*LEAD_SERIALIZER_ONLY_FIELDS),
             pk=pk
         )
 
@@ -850,25 +770,8 @@ class LeadFollowUpStatusUpdateView(APIView):
         Update follow-up status of a lead.
         """
         lead_obj = self.get_object(pk)
-        
-        # Validate user has profile
-        if not hasattr(request.user, 'profile') or request.user.profile is None:
-            return Response(
-                {"error": True, "message": "User profile not found."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        
-        user_profile = request.user.profile
-        user_role = int(user_profile.role) if user_profile.role is not None else None
-        
-        # Role-based permission check
-        if user_role == UserRole.EMPLOYEE.value:
-            # Employees can only update leads assigned to them
-            if lead_obj.assigned_to != user_profile:
-                return Response(
-                    {"error": True, "message": "You can only update follow-up status for leads assigned to you."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        # Employees can only act on leads assigned to them
+        self.check_object_permissions(request, lead_obj)
         
         # Get follow_up_status from request data
         follow_up_status = request.data.get("follow_up_status")
@@ -891,6 +794,8 @@ class LeadFollowUpStatusUpdateView(APIView):
         
         # Update the follow-up status
         lead_obj.follow_up_status = follow_up_status
+        # save() rather than queryset.update() so post_save still invalidates
+        # the cached reminders; the row is already loaded for the response
         lead_obj.save(update_fields=["follow_up_status"])
         
         # Return updated lead data
@@ -935,15 +840,17 @@ class ProjectListView(APIView, LimitOffsetPagination):
             )
             .filter(is_active=True, is_project=True)  # Only projects
             .order_by("-created_at")
+            # Only the columns LeadSerializer renders
+            .only(*LEAD_SERIALIZER_ONLY_FIELDS)
         )
         
         # Role-based filtering
         if request.user.is_authenticated and hasattr(request.user, 'profile'):
             user_profile = request.user.profile
-            user_role = int(user_profile.role) if user_profile.role is not None else None
+            user_role = user_profile.role
             
             # Employees can only see projects assigned to them
-            if user_role == UserRole.EMPLOYEE.value:
+            if user_role == ROLE_EMPLOYEE:
                 queryset = queryset.filter(assigned_to=user_profile)
             # Managers can see all projects (no additional filter needed)
         
@@ -956,28 +863,33 @@ class ProjectListView(APIView, LimitOffsetPagination):
         # Get base queryset with role-based filtering
         queryset = self.get_queryset()
         
-        # Apply search filters
-        if params:
-            if params.get("name"):
-                queryset = queryset.filter(
-                    Q(company_name__icontains=params.get("name"))
-                    | Q(contact_first_name__icontains=params.get("name"))
-                    | Q(contact_last_name__icontains=params.get("name"))
-                )
-            if params.get("email"):
-                queryset = queryset.filter(
-                    contact_email__icontains=params.get("email")
-                )
-            if params.get("status"):
-                queryset = queryset.filter(status=params.get("status"))
-            if params.get("assigned_to"):
-                queryset = queryset.filter(assigned_to=params.get("assigned_to"))
+        # Apply search filters, reading each param once
+        name = params.get("name")
+        email = params.get("email")
+        status_id = params.get("status")
+        assigned_to = params.get("assigned_to")
+        if name:
+            queryset = queryset.filter(
+                Q(company_name__icontains=name)
+                | Q(contact_first_name__icontains=name)
+                | Q(contact_last_name__icontains=name)
+            )
+        if email:
+            queryset = queryset.filter(
+                contact_email__icontains=email
+            )
+        if status_id:
+            queryset = queryset.filter(status=status_id)
+        if assigned_to:
+            queryset = queryset.filter(assigned_to=assigned_to)
         
         context = {}
         serializer = LeadSerializer(queryset, many=True)
-        
-        context["projects_count"] = queryset.count()
-        context["projects"] = serializer.data
+        projects_data = serializer.data
+
+        # The serializer already fetched every row, so count them in Python
+        context["projects_count"] = len(projects_data)
+        context["projects"] = projects_data
         
         return context
 
@@ -995,12 +907,14 @@ class LeadConvertToProjectView(APIView):
         - Accepts `is_project` (bool) in the request body to set the target state
         - Defaults to True to keep backward compatibility with the old behavior
     """
-    permission_classes = (IsAuthenticated,)
+    # Non-managers are turned away before the lead is fetched
+    permission_classes = (IsAuthenticated, HasProfile, IsManager)
+    manager_permission_message = "Only managers can convert leads or projects."
 
     def get_object(self, pk):
         """Get lead object with optimizations"""
         return get_object_or_404(
-            Lead.objects.select_related('status', 'lifecycle', 'assigned_to', 'assigned_to__user'),
+            Lead.objects.select_related('status', 'lifecycle', 'assigned_to', 'assigned_to__user', 'created_by'),
             pk=pk
         )
 
@@ -1010,23 +924,6 @@ class LeadConvertToProjectView(APIView):
         """
         lead_obj = self.get_object(pk)
         
-        # Validate user has profile
-        if not hasattr(request.user, 'profile') or request.user.profile is None:
-            return Response(
-                {"error": True, "message": "User profile not found."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        
-        user_profile = request.user.profile
-        user_role = int(user_profile.role) if user_profile.role is not None else None
-        
-        # Only managers can convert between lead and project
-        if user_role != UserRole.MANAGER.value and not request.user.is_superuser:
-            return Response(
-                {"error": True, "message": "Only managers can convert leads or projects."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        
         # Determine desired state (default True for backward compatibility)
         desired_is_project = request.data.get("is_project", True)
 
@@ -1092,21 +989,26 @@ class LeadNotesListView(APIView):
         - Employees: Can only create notes for leads assigned to them
         - Managers: Can create notes for any lead
     """
-    permission_classes = (IsAuthenticated,)
+    # Object permission checked once the profile is validated
+    permission_classes = (IsAuthenticated, IsLeadOwnerOrManager)
+    lead_permission_message = {
+        "GET": "You can only view notes for leads assigned to you.",
+        "POST": "You can only create notes for leads assigned to you.",
+    }
 
     def get_lead(self, pk):
-        """Get lead object with optimizations"""
-        return get_object_or_404(
-            Lead.objects.select_related('status', 'assigned_to', 'assigned_to__user'),
-            pk=pk
-        )
+        """
+        Get the lead, checking the user may access it (403 otherwise).
+        Only the columns the notes endpoints and the permission check need.
+        """
+        lead_obj = get_object_or_404(Lead.objects.only('id', 'title', 'assigned_to_id'), pk=pk)
+        self.check_object_permissions(self.request, lead_obj)
+        return lead_obj
 
     def get(self, request, pk, **kwargs):
         """
         Get all notes for a specific lead.
         """
-        lead_obj = self.get_lead(pk)
-        
         # Validate user has profile
         if not hasattr(request.user, 'profile') or request.user.profile is None:
             return Response(
@@ -1114,31 +1016,29 @@ class LeadNotesListView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        user_profile = request.user.profile
-        user_role = int(user_profile.role) if user_profile.role is not None else None
-        
-        # Role-based permission check
-        if user_role == UserRole.EMPLOYEE.value:
-            # Employees can only see notes for leads assigned to them
-            if lead_obj.assigned_to != user_profile:
-                return Response(
-                    {"error": True, "message": "You can only view notes for leads assigned to you."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        # Employees can only use notes of leads assigned to them
+        lead_obj = self.get_lead(pk)
         
-        # Get all notes for this lead, ordered by created_at (oldest first)
+        # Get all notes for this lead, ordered by created_at (oldest first),
+        # with the current user's read state resolved in the same query
         notes = LeadNote.objects.filter(lead=lead_obj).select_related(
+            'lead',
             'author',
             'author__user'
+        ).annotate(
+            is_read=Exists(
+                LeadNoteRead.objects.filter(note=OuterRef('pk'), user=request.user)
+            )
         ).order_by('created_at')
         
         # Serialize notes with read status
+        notes = list(notes)
         serializer = LeadNoteSerializer(notes, many=True, context={'request': request})
         
         return Response({
             "success": True,
             "lead_id": str(lead_obj.id),
-            "count": notes.count(),
+            "count": len(notes),
             "notes": serializer.data
         }, status=status.HTTP_200_OK)
 
@@ -1147,8 +1047,6 @@ class LeadNotesListView(APIView):
         """
         Create a new note for a lead.
         """
-        lead_obj = self.get_lead(pk)
-        
         # Validate user has profile
         if not hasattr(request.user, 'profile') or request.user.profile is None:
             return Response(
@@ -1157,16 +1055,9 @@ class LeadNotesListView(APIView):
             )
         
         user_profile = request.user.profile
-        user_role = int(user_profile.role) if user_profile.role is not None else None
         
-        # Role-based permission check
-        if user_role == UserRole.EMPLOYEE.value:
-            # Employees can only create notes for leads assigned to them
-            if lead_obj.assigned_to != user_profile:
-                return Response(
-                    {"error": True, "message": "You can only create notes for leads assigned to you."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        # Employees can only use notes of leads assigned to them
+        lead_obj = self.get_lead(pk)
         
         # Validate and create note
         serializer = LeadNoteCreateSerializer(data=request.data)
@@ -1201,21 +1092,23 @@ class LeadNotesUnreadListView(APIView):
         - Employees: Can only see unread notes for leads assigned to them
         - Managers: Can see all unread notes
     """
-    permission_classes = (IsAuthenticated,)
+    # Object permission checked once the profile is validated
+    permission_classes = (IsAuthenticated, IsLeadOwnerOrManager)
+    lead_permission_message = "You can only view unread notes for leads assigned to you."
 
     def get_lead(self, pk):
-        """Get lead object with optimizations"""
-        return get_object_or_404(
-            Lead.objects.select_related('status', 'assigned_to', 'assigned_to__user'),
-            pk=pk
-        )
+        """
+        Get the lead, checking the user may access it (403 otherwise).
+        Only the columns the notes endpoints and the permission check need.
+        """
+        lead_obj = get_object_or_404(Lead.objects.only('id', 'title', 'assigned_to_id'), pk=pk)
+        self.check_object_permissions(self.request, lead_obj)
+        return lead_obj
 
     def get(self, request, pk, **kwargs):
         """
         Get all unread notes for a specific lead.
         """
-        lead_obj = self.get_lead(pk)
-        
         # Validate user has profile
         if not hasattr(request.user, 'profile') or request.user.profile is None:
             return Response(
@@ -1223,30 +1116,28 @@ class LeadNotesUnreadListView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        user_profile = request.user.profile
-        user_role = int(user_profile.role) if user_profile.role is not None else None
-        
-        # Role-based permission check
-        if user_role == UserRole.EMPLOYEE.value:
-            # Employees can only see unread notes for leads assigned to them
-            if lead_obj.assigned_to != user_profile:
-                return Response(
-                    {"error": True, "message": "You can only view unread notes for leads assigned to you."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        # Employees can only use notes of leads assigned to them
+        lead_obj = self.get_lead(pk)
         
         # Get unread notes for this lead (notes that the current user hasn't read)
         # Exclude notes created by the current user and notes already read by them
+        # ~Exists plans as an anti-join on LeadNoteRead instead of a join
         unread_notes = LeadNote.objects.filter(
             lead=lead_obj
-        ).exclude(
-            read_by__user=request.user
+        ).filter(
+            ~Exists(LeadNoteRead.objects.filter(note=OuterRef('pk'), user=request.user))
         ).exclude(
             author=request.user.profile
         ).select_related(
+            'lead',
             'author',
             'author__user'
+        ).annotate(
+            # Unread by construction; saves LeadNoteSerializer a lookup per note
+            is_read=Value(False, output_field=BooleanField())
         ).order_by('created_at')
+        # Fetched once: the count comes from the same rows as the list
+        unread_notes = list(unread_notes)
         
         # Serialize unread notes
         serializer = LeadNoteSerializer(unread_notes, many=True, context={'request': request})
@@ -1254,12 +1145,85 @@ class LeadNotesUnreadListView(APIView):
         return Response({
             "success": True,
             "lead_id": str(lead_obj.id),
-            "count": unread_notes.count(),
+            "count": len(unread_notes),
             "unread_notes": serializer.data
         }, status=status.HTTP_200_OK)
 
 
 
+class LeadNotesUnreadBulkView(APIView):
+    """
+    API View for getting the unread notes of several leads at once.
+    
+    GET: ?lead_ids=<id>,<id>,... returns the unread notes of each requested
+    lead keyed by lead id, in two queries however many leads are asked for.
+    Leads that don't exist or aren't accessible are left out.
+        - Employees: Only leads assigned to them
+        - Managers: Any lead
+    """
+    permission_classes = (IsAuthenticated, HasProfile)
+    # Upper bound on ?lead_ids= so one request can't fan out over every lead
+    max_leads = 100
+
+    def get_lead_ids(self):
+        """Parse ?lead_ids= into UUIDs; returns None if it is missing or malformed"""
+        raw_ids = [value.strip() for value in self.request.query_params.get('lead_ids', '').split(',')]
+        try:
+            lead_ids = [uuid.UUID(value) for value in raw_ids if value]
+        except ValueError:
+            return None
+        if not 1 <= len(lead_ids) <= self.max_leads:
+            return None
+        return lead_ids
+
+    def get(self, request, **kwargs):
+        """
+        Get the unread notes of each requested lead.
+        """
+        lead_ids = self.get_lead_ids()
+        if lead_ids is None:
+            return Response(
+                {"error": True, "message": f"lead_ids must list 1 to {self.max_leads} comma-separated lead ids."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        
+        user_profile = request.user.profile
+        
+        # Same unread rule as LeadNotesUnreadListView; note.lead is filled in
+        # by the prefetch, so only the author is joined
+        unread_notes = LeadNote.objects.filter(
+            ~Exists(LeadNoteRead.objects.filter(note=OuterRef('pk'), user=request.user))
+        ).exclude(
+            author=user_profile
+        ).select_related(
+            'author',
+            'author__user'
+        ).annotate(
+            is_read=Value(False, output_field=BooleanField())
+        ).order_by('created_at')
+        
+        # Role-based scoping: employees only resolve leads assigned to them
+        leads = Lead.objects.filter(id__in=lead_ids).only('id', 'title')
+        if user_profile.role == ROLE_EMPLOYEE:
+            leads = leads.filter(assigned_to=user_profile)
+        leads = leads.prefetch_related(
+            Prefetch('notes', queryset=unread_notes, to_attr='unread_notes')
+        )
+        
+        return Response({
+            "success": True,
+            "unread_notes": {
+                str(lead.id): {
+                    "count": len(lead.unread_notes),
+                    "notes": LeadNoteSerializer(
+                        lead.unread_notes, many=True, context={'request': request}
+                    ).data,
+                }
+                for lead in leads
+            },
+        }, status=status.HTTP_200_OK)
+
+
 class LeadNoteDetailView(APIView):
     """
     API View for retrieving and deleting a specific note.
@@ -1267,15 +1231,25 @@ class LeadNoteDetailView(APIView):
     GET: Get a specific note
     DELETE: Delete a note (only by author)
     """
-    permission_classes = (IsAuthenticated,)
+    # HasProfile rejects users without a profile before any note is fetched;
+    # GET then checks the note's lead with IsLeadOwnerOrManager
+    permission_classes = (IsAuthenticated, HasProfile, IsLeadOwnerOrManager)
+    lead_permission_message = "You can only view notes for leads assigned to you."
 
     def get_note(self, pk, note_pk):
-        """Get note object with optimizations"""
-        lead_obj = get_object_or_404(Lead, pk=pk)
+        """
+        Get note object with optimizations (404 if the note or its lead is missing).
+        The lead, author and the current user's read state come back in the
+        same query, so the permission check and serializer need no more.
+        """
         return get_object_or_404(
-            LeadNote.objects.select_related('lead', 'author', 'author__user'),
+            LeadNote.objects.select_related('lead', 'author', 'author__user').annotate(
+                is_read=Exists(
+                    LeadNoteRead.objects.filter(note=OuterRef('pk'), user=self.request.user)
+                )
+            ),
             pk=note_pk,
-            lead=lead_obj
+            lead_id=pk,
         )
 
     def get(self, request, pk, note_pk, **kwargs):
@@ -1284,24 +1258,8 @@ class LeadNoteDetailView(APIView):
         """
         note_obj = self.get_note(pk, note_pk)
         
-        # Validate user has profile
-        if not hasattr(request.user, 'profile') or request.user.profile is None:
-            return Response(
-                {"error": True, "message": "User profile not found."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        
-        user_profile = request.user.profile
-        user_role = int(user_profile.role) if user_profile.role is not None else None
-        
-        # Role-based permission check
-        if user_role == UserRole.EMPLOYEE.value:
-            # Employees can only see notes for leads assigned to them
-            if note_obj.lead.assigned_to != user_profile:
-                return Response(
-                    {"error": True, "message": "You can only view notes for leads assigned to you."},
-                    status=status.HTTP_403_FORBIDDEN,
-                )
+        # Employees can only see notes for leads assigned to them
+        self.check_object_permissions(request, note_obj.lead)
         
         serializer = LeadNoteSerializer(note_obj, context={'request': request})
         return Response({
@@ -1314,18 +1272,10 @@ class LeadNoteDetailView(APIView):
         Delete a note (only by author).
         """
         note_obj = self.get_note(pk, note_pk)
-        
-        # Validate user has profile
-        if not hasattr(request.user, 'profile') or request.user.profile is None:
-            return Response(
-                {"error": True, "message": "User profile not found."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        
         user_profile = request.user.profile
         
         # Only the author can delete the note
-        if note_obj.author != user_profile:
+        if note_obj.author_id != user_profile.id:
             return Response(
                 {"error": True, "message": "You can only delete your own notes."},
                 status=status.HTTP_403_FORBIDDEN,
@@ -1343,54 +1293,56 @@ class LeadNoteMarkReadView(APIView):
     API View for marking all unread notes of a lead as read.
     
     POST: Mark all unread notes of a lead as read by the current user
+        - Employees: Only for leads assigned to them
+        - Managers: For any lead
     """
-    permission_classes = (IsAuthenticated,)
+    # HasProfile rejects users without a profile before the lead is fetched
+    permission_classes = (IsAuthenticated, HasProfile, IsLeadOwnerOrManager)
+    lead_permission_message = "You can only mark notes as read for leads assigned to you."
 
     def get_lead(self, pk):
-        """Get lead object"""
-        return get_object_or_404(
-            Lead.objects.select_related('status', 'assigned_to', 'assigned_to__user'),
-            pk=pk
-        )
-
+        """
+        Get the lead, checking the user may access it (403 otherwise).
+        Only the id is needed, for the notes filter and the response, and
+        assigned_to_id for the permission check.
+        """
+        lead_obj = get_object_or_404(Lead.objects.only('id', 'assigned_to_id'), pk=pk)
+        self.check_object_permissions(self.request, lead_obj)
+        return lead_obj
 
     def post(self, request, pk, **kwargs):
         """
         Mark all unread notes of a lead as read by the current user.
         """
+        # Employees can only mark notes of leads assigned to them
         lead_obj = self.get_lead(pk)
         
-        # Validate user has profile
-        if not hasattr(request.user, 'profile') or request.user.profile is None:
-            return Response(
-                {"error": True, "message": "User profile not found."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        
-        user_profile = request.user.profile
-        user_role = int(user_profile.role) if user_profile.role is not None else None
-        
-       
-        
         # Get all unread notes for this lead (notes not read by current user and not created by them)
+        # ~Exists plans as an anti-join on LeadNoteRead instead of a join
         unread_notes = LeadNote.objects.filter(
             lead=lead_obj
-        ).exclude(
-            read_by__user=request.user
+        ).filter(
+            ~Exists(LeadNoteRead.objects.filter(note=OuterRef('pk'), user=request.user))
         ).exclude(
             author=request.user.profile
         )
         
-        # Mark all unread notes as read
-        marked_count = 0
-        for note in unread_notes:
-            _, created = LeadNoteRead.objects.get_or_create(
-                note=note,
-                user=request.user,
-                defaults={'created_by': request.user}
-            )
-            if created:
-                marked_count += 1
+        # Mark all unread notes as read with a single INSERT. bulk_create skips
+        # BaseModel.save, so the audit columns are filled the same way here;
+        # ignore_conflicts skips rows a concurrent request inserted under
+        # unique (note, user)
+        new_reads = [
+            LeadNoteRead(note_id=note_id, user=request.user)
+            for note_id in unread_notes.values_list('id', flat=True)
+        ]
+        for note_read in new_reads:
+            note_read.set_audit_fields()
+        LeadNoteRead.objects.bulk_create(new_reads, ignore_conflicts=True)
+        
+        # Notes whose reads already existed were left out by the fetch above,
+        # so every new read counts. A concurrent mark-read of the same notes
+        # can count them too; the constraint still stores each read once.
+        marked_count = len(new_reads)
         
         return Response(
             {
@@ -1403,116 +1355,357 @@ class LeadNoteMarkReadView(APIView):
         )
 
 
-class RemindersListView(APIView):
+class RemindersBaseView(APIView):
     """
-    API View for getting reminders categorized by status.
-    
-    GET: Returns reminders in 4 categories:
-        - overdue: follow_up_at is in the past and follow_up_status is 'pending'
-        - due_today: follow_up_at is today and follow_up_status is 'pending'
-        - upcoming: follow_up_at is in the future and follow_up_status is 'pending'
-        - done: follow_up_status is 'done'
+    Shared plumbing for the reminders endpoints.
     
     Role-based filtering:
         - Employees: Only see reminders for leads assigned to them
         - Managers: See all reminders
     """
     permission_classes = (IsAuthenticated,)
+    # Manager payloads can hold thousands of leads; encode them with orjson
+    renderer_classes = (ORJSONRenderer,)
+    # Base queryset: only active leads with follow_up_at set. Built once at
+    # import time; get_queryset() clones it with .all() like DRF's generic views
+    queryset = Lead.objects.filter(
+        is_active=True,
+        follow_up_at__isnull=False
+    ).select_related(
+        'status',
+        'lifecycle',
+        'assigned_to__user',
+        'created_by'
+    ).only(*LEAD_SERIALIZER_ONLY_FIELDS)
+    serializer_class = LeadSerializer
 
     def get_queryset(self):
         """Get queryset with role-based filtering"""
         request = self.request
+        queryset = self.queryset.all()
         
-        # Base queryset: only active leads with follow_up_at set
-        queryset = Lead.objects.filter(
-            is_active=True,
-            follow_up_at__isnull=False
-        ).select_related(
-            'status',
-            'assigned_to',
-            'assigned_to__user',
-            'created_by'
-        )
-        
-        # Role-based filtering
-        if request.user.is_authenticated and hasattr(request.user, 'profile'):
-            user_profile = request.user.profile
-            user_role = int(user_profile.role) if user_profile.role is not None else None
-            
-            # Employees can only see reminders for leads assigned to them
-            if user_role == UserRole.EMPLOYEE.value:
-                queryset = queryset.filter(assigned_to=user_profile)
-            # Managers can see all reminders (no additional filter needed)
+        # Role-based filtering (IsAuthenticated has already rejected anonymous users)
+        user_profile = getattr(request.user, 'profile', None)
+        # Employees can only see reminders for leads assigned to them;
+        # managers can see all reminders (no additional filter needed)
+        if user_profile is not None and user_profile.role == ROLE_EMPLOYEE:
+            queryset = queryset.filter(assigned_to_id=user_profile.id)
         
         return queryset
 
+    def parse_page_size(self, default=None):
+        """
+        Read ?page_size= from the request.
+        Returns (page_size, error_response); page_size is default when absent.
+        """
+        page_size = self.request.query_params.get('page_size')
+        if page_size is None:
+            return default, None
+        try:
+            page_size = int(page_size)
+        except ValueError:
+            page_size = 0
+        if not 1 <= page_size <= REMINDERS_MAX_PAGE_SIZE:
+            return None, Response(
+                {"error": True, "message": f"page_size must be between 1 and {REMINDERS_MAX_PAGE_SIZE}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return page_size, None
+
+    def get_bucket_page(self, queryset, name, page_size, cursor=None):
+        """
+        One page of a bucket's leads, keyset-paginated on (follow_up_at, id).
+        queryset must already be filtered to the bucket.
+        Returns (leads, next_cursor); next_cursor is None on the last page.
+        """
+        # Done reminders are listed most recent first
+        descending = name == "done"
+        
+        if cursor is not None:
+            follow_up_at, lead_id = cursor
+            if descending:
+                queryset = queryset.filter(
+                    Q(follow_up_at__lt=follow_up_at) | Q(follow_up_at=follow_up_at, id__lt=lead_id)
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(follow_up_at__gt=follow_up_at) | Q(follow_up_at=follow_up_at, id__gt=lead_id)
+                )
+        
+        ordering = ('-follow_up_at', '-id') if descending else ('follow_up_at', 'id')
+        # Fetch one extra row to know whether another page exists
+        leads = list(queryset.order_by(*ordering)[:page_size + 1])
+        if len(leads) > page_size:
+            leads = leads[:page_size]
+            return leads, encode_reminder_cursor(leads[-1])
+        return leads, None
+
+    def get_cache_key(self, user_profile, day, variant=""):
+        """Cache key for this user's reminders payload; managers share one"""
+        if user_profile.role == ROLE_EMPLOYEE:
+            scope = f"profile:{user_profile.id}"
+        else:
+            # Every manager sees the same reminders
+            scope = "all"
+        return get_reminders_cache_key(scope, day, variant)
+
+    def get_cached_response(self, cache_key, build_response_data):
+        """
+        Return the cached JSON for cache_key, rendering build_response_data()
+        and caching the encoded bytes on a miss. Hits skip JSON encoding.
+        Without a shared cache the payload is rendered on every request.
+        """
+        if not settings.SHARED_CACHE:
+            content = ORJSONRenderer().render(build_response_data())
+            return HttpResponse(content, content_type="application/json")
+        content = cache.get(cache_key)
+        if content is None:
+            content = ORJSONRenderer().render(build_response_data())
+            cache.set(cache_key, content, REMINDERS_CACHE_TIMEOUT)
+        return HttpResponse(content, content_type="application/json")
+
+    def serialize_leads(self, leads):
+        """
+        Serialize leads with one serializer_class instance bound once per
+        request, instead of a fresh ListSerializer for every bucket or chunk.
+        """
+        if not hasattr(self, '_lead_serializer'):
+            self._lead_serializer = self.serializer_class()
+        return [self._lead_serializer.to_representation(lead) for lead in leads]
+
+
+class RemindersListView(RemindersBaseView):
+    """
+    API View for getting reminders categorized by status.
+    
+    GET: Returns reminders in 4 categories:
+        - overdue: follow_up_at is in the past and follow_up_status is 'pending'
+        - due_today: follow_up_at is today and follow_up_status is 'pending'
+        - upcoming: follow_up_at is in the future and follow_up_status is 'pending'
+        - done: follow_up_status is 'done'
+    """
+
+    def get_all_buckets(self, today_start, today_end):
+        """Every pending/done reminder, grouped by bucket"""
+        # Fetch every pending/done reminder in one query, tagged with its bucket by the database
+        reminders = self.get_queryset().filter(
+            follow_up_status__in=('pending', 'done')
+        ).annotate(
+            bucket=get_reminder_bucket_expression(today_start, today_end)
+        ).order_by('follow_up_at').iterator(chunk_size=REMINDERS_CHUNK_SIZE)
+        
+        # Serialize chunk by chunk so only one chunk of model instances is alive at a time;
+        # the done bucket in particular only ever grows
+        buckets = {name: [] for name in REMINDER_BUCKETS}
+        while True:
+            chunk = list(islice(reminders, REMINDERS_CHUNK_SIZE))
+            if not chunk:
+                break
+            chunk_buckets = {}
+            for lead in chunk:
+                chunk_buckets.setdefault(lead.bucket, []).append(lead)
+            for name, leads in chunk_buckets.items():
+                buckets[name].extend(self.serialize_leads(leads))
+        
+        # Done reminders are listed most recent first
+        buckets["done"].reverse()
+        
+        response_data = {"success": True}
+        for name, leads in buckets.items():
+            response_data[name] = {
+                "count": len(leads),
+                "leads": leads
+            }
+        return response_data
+
+    def get_paginated_buckets(self, today_start, today_end, page_size, cursors):
+        """One page per bucket"""
+        queryset = self.get_queryset()
+        filters = get_reminder_bucket_filters(today_start, today_end)
+        
+        # The totals aggregate and the four page queries are independent, so issue them
+        # concurrently instead of paying one database round trip after another
+        counts, *pages = run_concurrently(
+            partial(
+                queryset.aggregate,
+                **{name: Count('id', filter=bucket_filter) for name, bucket_filter in filters.items()}
+            ),
+            *(
+                partial(self.get_bucket_page, queryset.filter(filters[name]), name, page_size, cursors.get(name))
+                for name in REMINDER_BUCKETS
+            ),
+        )
+        
+        response_data = {"success": True}
+        for name, (leads, next_cursor) in zip(REMINDER_BUCKETS, pages):
+            response_data[name] = {
+                "count": counts[name],
+                "leads": self.serialize_leads(leads),
+                "next_cursor": next_cursor,
+            }
+        return response_data
 
     def get(self, request, *args, **kwargs):
         """
         Get all reminders categorized by status.
+        
+        Pass ?page_size=N to get at most N leads per bucket. Each bucket then
+        carries a next_cursor, sent back as ?<bucket>_cursor= for its next page.
         """
         # Validate user has profile
-        if not hasattr(request.user, 'profile') or request.user.profile is None:
+        user_profile = getattr(request.user, 'profile', None)
+        if user_profile is None:
             return Response(
                 {"error": True, "message": "User profile not found."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        now = timezone.now()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        today_end = today_start + timedelta(days=1)
+        page_size, error_response = self.parse_page_size()
+        if error_response is not None:
+            return error_response
+        
+        cursors = {}
+        if page_size is not None:
+            for name in REMINDER_BUCKETS:
+                raw_cursor = request.query_params.get(f"{name}_cursor")
+                if not raw_cursor:
+                    continue
+                cursor = decode_reminder_cursor(raw_cursor)
+                if cursor is None:
+                    return Response(
+                        {"error": True, "message": f"Invalid {name}_cursor."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                cursors[name] = cursor
+        
+        today_start, today_end = get_today_bounds()
+        cache_key = self.get_cache_key(
+            user_profile, today_start.date(), variant=request.query_params.urlencode()
+        )
         
-        queryset = self.get_queryset()
+        if page_size is None:
+            return self.get_cached_response(
+                cache_key, lambda: self.get_all_buckets(today_start, today_end)
+            )
+        return self.get_cached_response(
+            cache_key,
+            lambda: self.get_paginated_buckets(today_start, today_end, page_size, cursors),
+        )
+
+
+class RemindersCountsView(RemindersBaseView):
+    """
+    API View for the reminder counters only, e.g. for sidebar badges.
+    
+    GET: Returns the number of reminders in each bucket from a single
+    GROUP BY query, without any lead data.
+    """
+
+    def get_counts(self, today_start, today_end):
+        """Number of reminders per bucket"""
+        # order_by() drops Lead's default ordering so it doesn't end up in the GROUP BY
+        rows = self.get_queryset().filter(
+            follow_up_status__in=('pending', 'done')
+        ).annotate(
+            bucket=get_reminder_bucket_expression(today_start, today_end)
+        ).values('bucket').annotate(count=Count('id')).order_by()
+        
+        response_data = {"success": True}
+        response_data.update({name: 0 for name in REMINDER_BUCKETS})
+        for row in rows:
+            response_data[row['bucket']] = row['count']
+        return response_data
+
+    def get(self, request, *args, **kwargs):
+        # Validate user has profile
+        user_profile = getattr(request.user, 'profile', None)
+        if user_profile is None:
+            return Response(
+                {"error": True, "message": "User profile not found."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
         
-        # Overdue: follow_up_at is in the past and status is 'pending'
-        overdue = queryset.filter(
-            follow_up_at__lt=today_start,
-            follow_up_status='pending'
-        ).order_by('follow_up_at')
-        
-        # Due today: follow_up_at is today and status is 'pending'
-        due_today = queryset.filter(
-            follow_up_at__gte=today_start,
-            follow_up_at__lt=today_end,
-            follow_up_status='pending'
-        ).order_by('follow_up_at')
-        
-        # Upcoming: follow_up_at is in the future (after today) and status is 'pending'
-        upcoming = queryset.filter(
-            follow_up_at__gte=today_end,
-            follow_up_status='pending'
-        ).order_by('follow_up_at')
-        
-        # Done: follow_up_status is 'done'
-        done = queryset.filter(
-            follow_up_status='done'
-        ).order_by('-follow_up_at')
-        
-        # Serialize all categories
-        overdue_serializer = LeadSerializer(overdue, many=True)
-        due_today_serializer = LeadSerializer(due_today, many=True)
-        upcoming_serializer = LeadSerializer(upcoming, many=True)
-        done_serializer = LeadSerializer(done, many=True)
+        today_start, today_end = get_today_bounds()
+        cache_key = self.get_cache_key(user_profile, today_start.date(), variant="counts")
+        return self.get_cached_response(
+            cache_key, lambda: self.get_counts(today_start, today_end)
+        )
+
+
+class RemindersBucketListView(RemindersBaseView):
+    """
+    API View for paging through a single reminders bucket.
+    
+    GET: Returns up to ?page_size= leads (default 20) of the bucket named in
+    the URL, plus the bucket's total count and a next_cursor to pass back as
+    ?cursor= for the following page. Leads use the flat ReminderLeadSerializer.
+    """
+    queryset = Lead.objects.filter(
+        is_active=True,
+        follow_up_at__isnull=False
+    ).select_related(
+        'status',
+        'assigned_to__user'
+    ).only(*REMINDER_LEAD_SERIALIZER_ONLY_FIELDS)
+    serializer_class = ReminderLeadSerializer
+
+    def get_bucket(self, bucket, today_start, today_end, page_size, cursor):
+        """One page of the given bucket with its total count"""
+        queryset = self.get_queryset().filter(
+            get_reminder_bucket_filters(today_start, today_end)[bucket]
+        )
+        (leads, next_cursor), count = run_concurrently(
+            partial(self.get_bucket_page, queryset, bucket, page_size, cursor),
+            queryset.count,
+        )
         
-        return Response({
+        return {
             "success": True,
-            "overdue": {
-                "count": overdue.count(),
-                "leads": overdue_serializer.data
-            },
-            "due_today": {
-                "count": due_today.count(),
-                "leads": due_today_serializer.data
-            },
-            "upcoming": {
-                "count": upcoming.count(),
-                "leads": upcoming_serializer.data
-            },
-            "done": {
-                "count": done.count(),
-                "leads": done_serializer.data
-            }
-        }, status=status.HTTP_200_OK)
+            "bucket": bucket,
+            "count": count,
+            "leads": self.serialize_leads(leads),
+            "next_cursor": next_cursor,
+        }
+
+    def get(self, request, bucket, *args, **kwargs):
+        # Validate user has profile
+        user_profile = getattr(request.user, 'profile', None)
+        if user_profile is None:
+            return Response(
+                {"error": True, "message": "User profile not found."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        
+        if bucket not in REMINDER_BUCKETS:
+            return Response(
+                {"error": True, "message": f"Unknown reminders bucket '{bucket}'."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        
+        page_size, error_response = self.parse_page_size(default=REMINDERS_DEFAULT_PAGE_SIZE)
+        if error_response is not None:
+            return error_response
+        
+        cursor = None
+        raw_cursor = request.query_params.get('cursor')
+        if raw_cursor:
+            cursor = decode_reminder_cursor(raw_cursor)
+            if cursor is None:
+                return Response(
+                    {"error": True, "message": "Invalid cursor."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        
+        today_start, today_end = get_today_bounds()
+        cache_key = self.get_cache_key(
+            user_profile, today_start.date(),
+            variant=f"{bucket}:{request.query_params.urlencode()}",
+        )
+        return self.get_cached_response(
+            cache_key,
+            lambda: self.get_bucket(bucket, today_start, today_end, page_size, cursor),
+        )
+
 
 class OptionsView(APIView):
     """
@@ -1531,48 +1724,17 @@ class OptionsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        if int(request.user.profile.role) == UserRole.MANAGER.value:
-            users = Profile.objects.filter(
-                is_active=True,
-                user__is_active=True,
-                user__is_deleted=False,
-            ).select_related('user').order_by('user__first_name', 'user__last_name')
-        
-        else:
-            users = Profile.objects.filter(
-                is_active=True,
-                user__is_active=True,
-                user__is_deleted=False,
-                role=UserRole.EMPLOYEE.value
-            ).select_related('user').order_by('user__first_name', 'user__last_name')
+        # Serialized employees, cached per role
+        employees_data = get_lead_employee_options(request.user)
             
-            # Serialize employees
-        employees_serializer = EmployeeSerializer(users, many=True)
-            
-        # Get all lead sources
-        lead_sources = LeadSource.objects.all().order_by('source')
-        lead_sources_data = [
-            {"id": source.id, "name": source.source}
-            for source in lead_sources
-        ]
-
-        # Get all lead statuses
-        statuses = LeadStatus.objects.all().order_by('sort_order', 'name')
-        statuses_data = [
-            {"id": status.id, "name": status.name}
-            for status in statuses
-        ]
-
-        # Get all lead lifecycles
-        lifecycles = LeadLifecycle.objects.all().order_by('sort_order', 'name')
-        lifecycles_data = [
-            {"id": lifecycle.id, "name": lifecycle.name}
-            for lifecycle in lifecycles
-        ]
+        # Get all lead sources, statuses and lifecycles
+        lead_sources_data = get_lead_source_options()
+        statuses_data = get_lead_status_options()
+        lifecycles_data = get_lead_lifecycle_options()
        
         return Response({
             "success": True,
-            "employees": employees_serializer.data,
+            "employees": employees_data,
             "lead_sources": lead_sources_data,
             "lead_statuses": statuses_data,
             "lead_lifecycles": lifecycles_data,
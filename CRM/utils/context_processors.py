@@ -1,7 +1,13 @@
+from types import MappingProxyType
+
 from utils.roles_enum import UserRole
 
+# Built once at import; read-only so no template render can change it
+_ROLE_CONSTANTS = MappingProxyType({
+    'ROLE_MANAGER_VALUE': UserRole.MANAGER.value,
+    'ROLE_EMPLOYEE_VALUE': UserRole.EMPLOYEE.value,
+})
+
+
 def role_constants(request):
-    return {
-        'ROLE_MANAGER_VALUE': UserRole.MANAGER.value,
-        'ROLE_EMPLOYEE_VALUE': UserRole.EMPLOYEE.value,
-    }
+    return _ROLE_CONSTANTS
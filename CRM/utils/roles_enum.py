@@ -3,3 +3,8 @@ from enum import Enum
 class UserRole(Enum):
     MANAGER = 0
     EMPLOYEE = 1
+
+# Plain ints for per-request role checks; UserRole.X.value goes through the
+# enum's value descriptor on every access
+ROLE_MANAGER = UserRole.MANAGER.value
+ROLE_EMPLOYEE = UserRole.EMPLOYEE.value
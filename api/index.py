@@ -6,9 +6,13 @@ from django.core.wsgi import get_wsgi_application
 BASE_DIR = Path(__file__).resolve().parent.parent
 CRM_DIR = BASE_DIR / "CRM"
 
-sys.path.insert(0, str(CRM_DIR))
+# vercel.json already puts CRM on PYTHONPATH; only add it when run without that
+if str(CRM_DIR) not in sys.path:
+    sys.path.insert(0, str(CRM_DIR))
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "crm.settings")
 
+# Stays on WSGI: the API is DRF 3.14 APIViews, which are sync only, and under
+# ASGI each would be funnelled through one sync_to_async thread per worker
 app = get_wsgi_application()
 